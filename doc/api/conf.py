@@ -27,9 +27,8 @@ import sys
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
 src_path = os.path.join(project_root, 'src')
 
-# Add both project root and src to sys.path
-sys.path.insert(0, project_root)
-sys.path.insert(0, src_path)
+# Add both project root and src to sys.path in one slice assignment
+sys.path[:0] = [src_path, project_root]
 
 autodoc_default_options = {
     'members': True,
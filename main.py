@@ -9,12 +9,29 @@ from src.game.pig_game_cli import PigGameCLI
 from src.constants import GAME_INTERRUPTED
 
 
+def _block_buffer_stdout():
+    """
+    Switches stdout from line buffering to block buffering.
+
+    A terminal stdout is line-buffered, so every printed line is its own write.
+    Block-buffered, a whole screen goes out in one write when the next prompt
+    is shown: input() flushes stdout before reading, and so does interpreter exit.
+    """
+    reconfigure = getattr(sys.stdout, "reconfigure", None)
+    if reconfigure is not None:
+        reconfigure(line_buffering=False)
+
+
 def main():
     """Main entry point."""
+    _block_buffer_stdout()
+    cli = None
     try:
         cli = PigGameCLI()
         cli.cmdloop()
     except KeyboardInterrupt:
+        if cli is not None:
+            cli.game.flush_high_scores()
         print(GAME_INTERRUPTED)
     except Exception as e:
         print(f"Error: {e}")
@@ -50,17 +50,24 @@ GAME_OVER_HEADER = """
 └─────────────────────────────────────┘
 """
 
+# Only the winner and score lines change between games, so the rest of the
+# banner is laid out once here and filled in with str.format().
+GAME_OVER_BANNER = (
+    "\n" + "=" * 40 + "\n" + f"{'🎉 GAME OVER! 🎉':^40}\n"
+    "{winner_line:^40}\n{score_line:^40}\n" + "=" * 40 + "\n"
+)
+
 # Commands Lists
 MAIN_MENU_COMMANDS = "\nCommands: 1, 2, 3, 4, 5, 6, 7, resume, help, quit"
 SETTINGS_MENU_COMMANDS = "\nCommands: 1, 2, 3, 4, 5, 6, 7, back"
-DIFFICULTY_MENU_COMMANDS = "\nCommands: 1, 2, 3, 4, 5, 6, 7, back"
+DIFFICULTY_MENU_COMMANDS = SETTINGS_MENU_COMMANDS
 GAME_COMMANDS = "\nCommands: roll, hold, status, cheat [code], restart, save [filename], load [filename], menu, quit"
 
 # Help Messages
 GAME_HELP = """
 🎲 GAME COMMANDS:
-roll         - Roll the dice
-hold         - Hold your turn and pass to next player
+roll (r)     - Roll the dice
+hold (h)     - Hold your turn and pass to next player
 status       - Show current game status
 cheat [code] - Input a cheat code during gameplay
 restart      - Restart the current game
@@ -68,7 +75,7 @@ save [name]  - Save the current game
 load [name]  - Load a saved game
 menu         - Go back to main menu
 help         - Show this help
-quit         - Exit the game
+quit (q)     - Exit the game
 """
 
 MAIN_MENU_HELP = """
@@ -199,14 +206,14 @@ CURRENT_PLAYER_FORMAT = "Current Player: {}"
 TURN_SCORE_FORMAT = "Turn Score: {} points"
 SCORE_TO_WIN_FORMAT = "Score to Win: {} points"
 
-# Difficulty Messages
-DIFFICULTY_SET_SUCCESS = "Difficulty set to {}!"
+# Difficulty Messages (same text as DIFFICULTY_SET above)
+DIFFICULTY_SET_SUCCESS = DIFFICULTY_SET
 FAILED_SET_DIFFICULTY = "Failed to set difficulty."
 
-# Settings Menu Messages
-PLAYER1_NAME_SET_SUCCESS = "Player 1 name set to '{}'!"
-PLAYER2_NAME_SET_SUCCESS = "Player 2 name set to '{}'!"
-GAME_SAVED_SUCCESS = "Game saved: {}"
+# Settings Menu Messages (same text as the success messages above)
+PLAYER1_NAME_SET_SUCCESS = PLAYER1_NAME_SET
+PLAYER2_NAME_SET_SUCCESS = PLAYER2_NAME_SET
+GAME_SAVED_SUCCESS = GAME_SAVED
 
 # Menu Choice Messages
 RETURNING_TO_SETTINGS = "Returning to settings..."
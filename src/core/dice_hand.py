@@ -1,4 +1,5 @@
-from typing import List
+import random
+from typing import List, Optional
 from src.core.die import Die
 
 
@@ -19,6 +20,8 @@ class DiceHand:
         Returns the sum of all last roll results.
     """
 
+    __slots__ = ("_dice", "_sides", "_last_results", "_last_total")
+
     def __init__(self, dice: List[Die]):
         """
         Initialize a hand of dice.
@@ -36,7 +39,10 @@ class DiceHand:
         if not dice:
             raise ValueError("DiceHand must contain at least one Die.")
         self._dice = dice
+        # Die sides never change, so roll_all() reads them from a flat tuple.
+        self._sides = tuple(die.sides for die in dice)
         self._last_results: List[int] = []
+        self._last_total: Optional[int] = None  # None until the first roll
 
     @property
     def dice(self) -> List[Die]:
@@ -52,7 +58,10 @@ class DiceHand:
         List[int]
             List of results for each die rolled.
         """
-        self._last_results = [die.roll() for die in self._dice]
+        # Same draw as Die.roll(), without a method call and property read per die.
+        randint = random.randint
+        self._last_results = [randint(1, sides) for sides in self._sides]
+        self._last_total = sum(self._last_results)
         return self._last_results
 
     @property
@@ -70,6 +79,6 @@ class DiceHand:
         RuntimeError
             If no dice have been rolled yet.
         """
-        if not self._last_results:
+        if self._last_total is None:
             raise RuntimeError("No roll results available. Call roll_all() first.")
-        return sum(self._last_results)
+        return self._last_total
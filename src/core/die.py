@@ -16,6 +16,8 @@ class Die:
         Rolls the die and returns the result.
     """
 
+    __slots__ = ("_sides",)
+
     def __init__(self, sides: int = 6):
         """
         Initialize a die with the given number of sides.
@@ -41,4 +43,6 @@ class Die:
 
     def roll(self) -> int:
         """Rolls the die and returns a random integer between 1 and number of sides."""
-        return random.randint(1, self._sides)
+        # randrange(n) goes straight to the rejection sampler; randint(1, n) adds
+        # a wrapper frame and start/stop checks to yield the same value.
+        return random.randrange(self._sides) + 1
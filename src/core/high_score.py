@@ -1,54 +1,182 @@
+import atexit
+import heapq
 import json
 import os
+import sys
 from datetime import datetime, timezone
-from typing import List, Dict, Tuple, Any
+from typing import List, Dict, Optional, Tuple, Any, TypedDict
 
 HIGHSCORE_FILE = os.path.join(
     os.path.dirname(__file__), "..", "data", "pig_highscore.json"
 )
 
 
+class PlayerRecord(TypedDict):
+    """Schema of one player's entry in HighScore.data (the file omits the averages)."""
+
+    name: str
+    games_played: int
+    wins: int
+    losses: int
+    total_score: int
+    created: str
+    last_played: str
+    best_score: int
+    winrate: float  # wins / games_played, kept current by record_game()
+    avg_score: float  # total_score / games_played, kept current by record_game()
+
+
+# Recomputed from the totals on load, so they are kept in memory and never saved.
+_DERIVED_FIELDS = frozenset(("winrate", "avg_score"))
+
+
+def _update_averages(rec: PlayerRecord) -> None:
+    """Refreshes a record's stored win rate and average score from its totals."""
+    games = rec.get("games_played", 0)
+    rec["winrate"] = rec.get("wins", 0) / games if games else 0.0
+    rec["avg_score"] = rec.get("total_score", 0) / games if games else 0.0
+
+
+def _rank_key(item: Tuple[str, PlayerRecord]) -> Tuple[int, float, float]:
+    """Ranking key for a (player_id, record) pair: wins, then win rate, then average."""
+    rec = item[1]
+    return (rec.get("wins", 0), rec["winrate"], rec["avg_score"])
+
+
 class HighScore:
     """Manages persistent high score / statistics JSON file."""
 
-    def __init__(self, filename=HIGHSCORE_FILE):
+    def __init__(
+        self, filename=HIGHSCORE_FILE, autosave: bool = True, flush_every: int = 1
+    ):
+        """
+        Args:
+            filename (str): Path of the JSON file backing the high scores.
+            autosave (bool): Write to disk automatically (default). When False,
+                changes are only written by flush() or at interpreter exit.
+                Batching instances (autosave off, or flush_every > 1) register
+                flush() to run at exit.
+            flush_every (int): With autosave, write once this many changes are
+                pending. Defaults to 1, i.e. after every recorded game.
+
+        Raises:
+            ValueError: If flush_every is less than 1.
+        """
+        if flush_every < 1:
+            raise ValueError("flush_every must be at least 1.")
         self.filename = filename
-        self.data: Dict[str, Dict[str, Any]] = {}
+        self.autosave = autosave
+        self.flush_every = flush_every
+        self._pending = 0  # Changes made since the last flush
+        self._last_saved: Optional[str] = None  # File contents as last read/written
+        self.data: Dict[str, PlayerRecord] = {}
+        self._name_index: Dict[str, str] = {}  # lowercase name -> player id
+        # Rankings and rendered tables, reused until the data next changes.
+        self._view_cache: Dict[Tuple, Any] = {}
+        # The directory only has to be created once, not before every save.
+        directory = os.path.dirname(self.filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
         self._load()
+        self._rebuild_name_index()
+        # Only a batching instance can hold unwritten changes at exit; the
+        # default one writes every change, and need not be kept alive by atexit.
+        if not autosave or flush_every > 1:
+            atexit.register(self.flush)
+
+    def _rebuild_name_index(self) -> None:
+        """Rebuilds the lowercase name -> player id lookup from the data."""
+        self._name_index = {
+            rec.get("name", "").lower(): pid for pid, rec in self.data.items()
+        }
 
     def _load(self):
         """Loads high score data from the JSON file."""
-        os.makedirs(os.path.dirname(self.filename), exist_ok=True)
-        if os.path.exists(self.filename):
-            try:
-                with open(self.filename, "r") as f:
-                    content = f.read()
-                    self.data = json.loads(content) if content else {}
-            except json.JSONDecodeError:
-                print(
-                    f"Warning: HighScore file '{self.filename}' is corrupted. Starting with empty data."
-                )
-                self.data = {}
-            except Exception as e:
-                print(f"Error loading HighScore file: {e}. Starting with empty data.")
-                self.data = {}
-        else:
+        try:
+            with open(self.filename, "r") as f:
+                content = f.read()
+                loaded = json.loads(content) if content else {}
+                # Entries that are not records cannot be ranked; drop them.
+                self.data = {
+                    sys.intern(pid): rec
+                    for pid, rec in loaded.items()
+                    if isinstance(rec, dict)
+                }
+                for rec in self.data.values():
+                    _update_averages(rec)
+                self._last_saved = content
+        except FileNotFoundError:
+            self.data = {}
+        except json.JSONDecodeError:
+            print(
+                f"Warning: HighScore file '{self.filename}' is corrupted. Starting with empty data."
+            )
+            self.data = {}
+        except Exception as e:
+            print(f"Error loading HighScore file: {e}. Starting with empty data.")
             self.data = {}
 
-    def _save(self):
-        """Saves the current high score data to the JSON file."""
-        os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+    def _save(self) -> bool:
+        """
+        Saves the current high score data to the JSON file, if it changed.
+
+        Returns:
+            bool: True if the file holds the current data, False if writing failed.
+        """
         try:
-            with open(self.filename, "w") as f:
-                json.dump(self.data, f, indent=4)
+            stored = {
+                pid: {k: v for k, v in rec.items() if k not in _DERIVED_FIELDS}
+                for pid, rec in self.data.items()
+            }
+            # Indented so the file stays readable; dumps() hands it a single write.
+            payload = json.dumps(stored, indent=4)
+            if payload == self._last_saved:
+                return True
+            # Write a sibling temp file and swap it in, so an interrupted save
+            # never leaves a truncated high score file behind.
+            tmp_name = self.filename + ".tmp"
+            with open(tmp_name, "w") as f:
+                f.write(payload)
+            os.replace(tmp_name, self.filename)
+            self._last_saved = payload
+            return True
         except Exception as e:
             print(f"Error saving HighScore file: {e}")
+            return False
+
+    def _mark_dirty(self) -> None:
+        """Records that data changed, writing it out once enough changes are pending."""
+        self._pending += 1
+        self._view_cache.clear()
+        if self.autosave and self._pending >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes pending changes to the JSON file, if there are any."""
+        # A failed write keeps the changes pending, so a later flush retries.
+        if self._pending and self._save():
+            self._pending = 0
+
+    def _ensure_player(
+        self, player_id: str, player_name: str, now_utc: Optional[str] = None
+    ) -> PlayerRecord:
+        """
+        Ensures a player record exists, initializing it if necessary.
+
+        Args:
+            player_id (str): Key of the player record.
+            player_name (str): Display name stored for a new record.
+            now_utc (str, optional): ISO timestamp for a new record's dates, so a
+                caller recording one event can share a single timestamp.
 
-    def _ensure_player(self, player_id: str, player_name: str) -> None:
-        """Ensures a player record exists, initializing it if necessary."""
-        if player_id not in self.data:
-            now_utc = datetime.now(timezone.utc).isoformat()
-            self.data[player_id] = {
+        Returns:
+            PlayerRecord: The player's record.
+        """
+        rec = self.data.get(player_id)
+        if rec is None:
+            if now_utc is None:
+                now_utc = datetime.now(timezone.utc).isoformat()
+            rec = self.data[sys.intern(player_id)] = {
                 "name": player_name,
                 "games_played": 0,
                 "wins": 0,
@@ -57,7 +185,11 @@ class HighScore:
                 "created": now_utc,
                 "last_played": now_utc,
                 "best_score": 0,
+                "winrate": 0.0,
+                "avg_score": 0.0,
             }
+            self._name_index[player_name.lower()] = player_id
+        return rec
 
     def record_game(
         self, winner: Any, loser: Any, winner_score: int, loser_score: int
@@ -71,8 +203,7 @@ class HighScore:
         """
         now_utc = datetime.now(timezone.utc).isoformat()
 
-        self._ensure_player(winner.player_id, winner.name)
-        w_rec = self.data[winner.player_id]
+        w_rec = self._ensure_player(winner.player_id, winner.name, now_utc)
 
         w_rec["games_played"] += 1
         w_rec["wins"] += 1
@@ -80,9 +211,9 @@ class HighScore:
         w_rec["last_played"] = now_utc
         if winner_score > w_rec.get("best_score", 0):
             w_rec["best_score"] = winner_score
+        _update_averages(w_rec)
 
-        self._ensure_player(loser.player_id, loser.name)
-        l_rec = self.data[loser.player_id]
+        l_rec = self._ensure_player(loser.player_id, loser.name, now_utc)
 
         l_rec["games_played"] += 1
         l_rec["losses"] += 1
@@ -90,81 +221,103 @@ class HighScore:
         l_rec["last_played"] = now_utc
         if loser_score > l_rec.get("best_score", 0):
             l_rec["best_score"] = loser_score
+        _update_averages(l_rec)
 
-        self._save()
+        self._mark_dirty()
 
-    def list_top(self, n: int = 10) -> List[Tuple[str, Dict[str, Any]]]:
-        def score_key(item):
-            pid, rec = item
-            wins = rec.get("wins", 0)
-            games = rec.get("games_played", 1)
-            winrate = wins / games if games else 0
-            avg_score = rec.get("total_score", 0) / games if games else 0
-            return (wins, winrate, avg_score)
+    def find_by_name(self, name: str) -> Tuple[Optional[str], Optional[PlayerRecord]]:
+        """
+        Finds a player record by name, ignoring case.
+
+        Returns:
+            Tuple[Optional[str], Optional[PlayerRecord]]: (player_id, record),
+            or (None, None) if no player has that name.
+        """
+        pid = self._name_index.get(name.lower())
+        if pid is None:
+            return None, None
+        return pid, self.data[pid]
 
-        items = sorted(self.data.items(), key=score_key, reverse=True)
-        return items[:n]
+    def list_top(self, n: int = 10) -> List[Tuple[str, PlayerRecord]]:
+        key = ("list_top", n)
+        if key not in self._view_cache:
+            self._view_cache[key] = self._rank_top(n)
+        return list(self._view_cache[key])
+
+    def _rank_top(self, n: int) -> List[Tuple[str, PlayerRecord]]:
+        # Only the top n are needed: O(P log n) instead of sorting every player.
+        return heapq.nlargest(n, self.data.items(), key=_rank_key)
 
     def get_scores_string(self) -> str:
+        key = ("scores_string",)
+        if key not in self._view_cache:
+            self._view_cache[key] = self._render_scores()
+        return self._view_cache[key]
+
+    def _render_scores(self) -> str:
         if not self.data:
             return "No players yet."
 
         output = ["\n=== HIGH SCORES / PLAYER STATS ==="]
-        rows = []
-        for pid, rec in self.data.items():
-            games = rec.get("games_played", 0)
-            wins = rec.get("wins", 0)
-            losses = rec.get("losses", 0)
-            winrate = (wins / games * 100) if games else 0
-            avg = (rec.get("total_score", 0) / games) if games else 0
-            rows.append(
-                (
-                    rec.get("name", "?"),
-                    pid,
-                    games,
-                    wins,
-                    losses,
-                    f"{winrate:.1f}%",
-                    f"{avg:.1f}",
-                )
-            )
 
-        rows.sort(key=lambda r: (r[3], float(r[6])), reverse=True)
+        # Read each record once into parallel numeric columns, rank on the
+        # numbers, and only format the strings for the final, sorted rows.
+        pids = list(self.data)
+        records = [self.data[pid] for pid in pids]
+        games = [rec.get("games_played", 0) for rec in records]
+        wins = [rec.get("wins", 0) for rec in records]
+        avgs = [rec["avg_score"] for rec in records]
+        order = sorted(range(len(pids)), key=lambda i: (wins[i], avgs[i]), reverse=True)
 
         header = " Name                        | Games | Wins | Losses | Win%  | Avg score | Player ID"
         output.append(header)
         output.append("-" * len(header))
 
-        for name, pid, games, wins, losses, winp, avg in rows:
+        for i in order:
+            rec = records[i]
+            winp = f"{rec['winrate'] * 100:.1f}%"
+            avg = f"{avgs[i]:.1f}"
             output.append(
-                f" {name:25} | {games:5} | {wins:4} | {losses:6} | {winp:5} | {avg:9} | {pid[:8]}"
+                f" {rec.get('name', '?'):25} | {games[i]:5} | {wins[i]:4} | "
+                f"{rec.get('losses', 0):6} | {winp:5} | {avg:9} | {pids[i][:8]}"
             )
 
         output.append("\n")
         return "\n".join(output)
 
     def get_top_players_string(self, n: int = 10) -> str:
+        key = ("top_players_string", n)
+        if key not in self._view_cache:
+            self._view_cache[key] = self._render_top_players(n)
+        return self._view_cache[key]
+
+    def _render_top_players(self, n: int) -> str:
         top_players = self.list_top(n)
 
         if not top_players:
             return "No player scores available."
 
-        result = "Top Player Scores (Ranked by Wins, Win%, Avg Score):\n"
-        result += "=" * 70 + "\n"
+        lines = ["Top Player Scores (Ranked by Wins, Win%, Avg Score):", "=" * 70]
 
         for i, (pid, rec) in enumerate(top_players, 1):
             name = rec.get("name", "Unknown")
             wins = rec.get("wins", 0)
             games = rec.get("games_played", 0)
-            winrate = (wins / games * 100) if games else 0
-            avg_score = rec.get("total_score", 0) / games if games else 0
+            winrate = rec["winrate"] * 100
+            avg_score = rec["avg_score"]
 
-            result += f"{i:2}. {name:20} | Wins: {wins:3} | Games: {games:3} | Win%: {winrate:5.1f}% | Avg: {avg_score:6.1f}\n"
+            lines.append(
+                f"{i:2}. {name:20} | Wins: {wins:3} | Games: {games:3} | "
+                f"Win%: {winrate:5.1f}% | Avg: {avg_score:6.1f}"
+            )
 
-        return result
+        # Joined once rather than grown with += per row; keeps the trailing newline.
+        lines.append("")
+        return "\n".join(lines)
 
     def clear_high_scores(self) -> str:
         """Clears high scores and returns a status message."""
         self.data = {}
-        self._save()
+        self._name_index = {}
+        self._mark_dirty()
         return "High scores cleared successfully."
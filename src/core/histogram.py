@@ -1,35 +1,65 @@
 from collections import Counter
-from typing import Dict, Any
+from typing import Dict, Any, Iterable
+
+# Bars are scaled to at most 40 units plus one, so every bar is built once here.
+_BAR_WIDTH = 40
+_BARS = ["█" * width for width in range(_BAR_WIDTH + 2)]
 
 
 class Histogram:
     """Simple ASCII histogram for dice rolls and turn totals."""
 
-    def __init__(self):
-        self.counts = Counter()
+    def __init__(self, max_value: int = 6):
+        """
+        Args:
+            max_value (int): Largest value counted in the fixed bucket list
+                (6 for a standard die). Values outside 0..max_value are still
+                counted, in a dict, so any range works.
+        """
+        self._max = max_value
+        self._buckets = [0] * (max_value + 1)
+        self._overflow: Dict[int, int] = {}
+
+    @property
+    def counts(self) -> Counter:
+        """Returns the counts per value as a Counter (a snapshot, not a live view)."""
+        return Counter(self.get_data())
 
     def add(self, value: int) -> None:
         """Adds a value to the histogram count."""
-        self.counts[value] += 1
+        if 0 <= value <= self._max:
+            self._buckets[value] += 1
+        else:
+            self._overflow[value] = self._overflow.get(value, 0) + 1
+
+    def add_many(self, values: Iterable[int]) -> None:
+        """Adds every value in values, as if add() were called for each one."""
+        # Counter tallies the batch in C; the buckets then take one add per value.
+        buckets, max_value, overflow = self._buckets, self._max, self._overflow
+        for value, c in Counter(values).items():
+            if 0 <= value <= max_value:
+                buckets[value] += c
+            else:
+                overflow[value] = overflow.get(value, 0) + c
 
     def get_data(self) -> Dict[int, int]:
         """Returns the raw histogram data."""
-        return dict(self.counts)
+        data = {value: c for value, c in enumerate(self._buckets) if c}
+        data.update(self._overflow)
+        return data
 
     def get_string(self, title: str = "Histogram") -> str:
         """Generates and returns the ASCII histogram string."""
-        output = [f"\n{title}"]
-        if not self.counts:
-            output.append(f"{title}: (no data)\n")
-            return "\n".join(output)
-
-        max_v = max(self.counts.values()) if self.counts else 1  # For scaling the bar
+        data = self.get_data()
+        if not data:
+            return f"\n{title}\n{title}: (no data)\n"
 
-        for k in sorted(self.counts.keys()):
-            v = self.counts[k]
-            bar_len = (v * 40 // max_v) if max_v > 0 else 0
-            bar = "█" * (bar_len + 1)
-            output.append(f" {k:>2}: {v:>4} | {bar} ({v})")
+        max_v = max(data.values())  # For scaling the bar
 
-        output.append("\n")
-        return "\n".join(output)
+        # Bucket values come out of get_data() already in order.
+        items = sorted(data.items()) if self._overflow else data.items()
+        rows = [
+            f" {k:>2}: {v:>4} | {_BARS[v * _BAR_WIDTH // max_v + 1]} ({v})"
+            for k, v in items
+        ]
+        return "\n".join([f"\n{title}", *rows, "\n"])
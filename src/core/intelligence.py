@@ -1,8 +1,36 @@
 import random
+from fractions import Fraction
+from itertools import accumulate
+
+# Rolls per computer turn for each difficulty.
+_ROLL_COUNTS = {
+    "noob": 2,
+    "casual": 4,
+    "challenger": 6,
+    "veteran": 8,
+    "elite": 10,
+    "legendary": 12,
+}
+
+# Each mode draws a roll by picking one of its first N sub-lists, then a face
+# from it; sub-list j (1-based) holds faces j..6. This flattens that two-step
+# draw into one cumulative weight table per mode for random.choices().
+_FACES = range(1, 7)
+_CUM_WEIGHTS = {
+    mode: [
+        float(w)
+        for w in accumulate(
+            sum(Fraction(1, 7 - j) for j in range(1, min(face, lists) + 1))
+            for face in _FACES
+        )
+    ]
+    for lists, mode in enumerate(_ROLL_COUNTS, 1)
+}
 
 
 class DiceDifficulty:
-    def __init__(self):
+    def __init__(self, verbose: bool = True):
+        self.verbose = verbose
         self.modes = ["noob", "casual", "challenger", "veteran", "elite", "legendary"]
 
     def get_available_difficulties(self):
@@ -46,40 +74,48 @@ class DiceDifficulty:
             [[1, 2, 3, 4, 5, 6], [2, 3, 4, 5, 6], [3, 4, 5, 6], [4, 5, 6], [5, 6], [6]]
         )
 
-    def roll(self, mode):
+    def roll_batch(self, mode, n):
+        """
+        Draws n rolls for a difficulty in one call.
+
+        The rolls follow the same distribution as calling the mode's method
+        n times, but come from a single random.choices() call instead of two
+        random.choice() calls per roll.
+        """
         mode = str(mode).strip().lower()
+        if mode not in _CUM_WEIGHTS:
+            raise ValueError("Unknown mode. Please try again.")
+        return random.choices(_FACES, cum_weights=_CUM_WEIGHTS[mode], k=n)
 
-        roll_counts = {
-            "noob": 2,
-            "casual": 4,
-            "challenger": 6,
-            "veteran": 8,
-            "elite": 10,
-            "legendary": 12,
-        }
+    def roll_fast(self, mode):
+        """
+        Plays a full computer turn like roll(), but silently and in one batch.
+
+        Meant for simulations: all of the turn's rolls are drawn up front and
+        the result is 1 if any of them busts, else their sum.
+        """
+        mode = str(mode).strip().lower()
+        if mode not in _ROLL_COUNTS:
+            raise ValueError("Unknown mode. Please try again.")
+        rolls = self.roll_batch(mode, _ROLL_COUNTS[mode])
+        return 1 if 1 in rolls else sum(rolls)
+
+    def roll(self, mode):
+        mode = str(mode).strip().lower()
 
-        if mode not in roll_counts:
+        if mode not in _ROLL_COUNTS:
             raise ValueError("Unknown mode. Please try again.")
 
+        # Every mode has a same-named method; resolve it once, not per roll.
+        roll_once = getattr(self, mode)
+        verbose = self.verbose
         total = 0
 
-        for i in range(roll_counts[mode]):
-
-            match mode:
-                case "noob":
-                    value = self.noob()
-                case "casual":
-                    value = self.casual()
-                case "challenger":
-                    value = self.challenger()
-                case "veteran":
-                    value = self.veteran()
-                case "elite":
-                    value = self.elite()
-                case "legendary":
-                    value = self.legendary()
-
-            print(f"Roll {i+1}: {value}")
+        for i in range(_ROLL_COUNTS[mode]):
+            value = roll_once()
+
+            if verbose:
+                print(f"Roll {i+1}: {value}")
 
             if value == 1:
                 return 1
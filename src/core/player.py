@@ -5,6 +5,7 @@ This file contains the Player class which represents a player in the Pig game.
 Each player has a name and current score.
 """
 
+import sys
 from typing import Optional
 import uuid
 
@@ -16,6 +17,8 @@ class Player:
     A player has a name and current score.
     """
 
+    __slots__ = ("_name", "_current_score", "_player_id")
+
     def __init__(self, name: str = "Player"):
         """
         Initialize a new player.
@@ -25,7 +28,26 @@ class Player:
         """
         self._name = name.strip() if name.strip() else "Player"
         self._current_score = 0
-        self.player_id = str(uuid.uuid4())
+        self._player_id: Optional[str] = None  # Generated on first use
+
+    @property
+    def player_id(self) -> str:
+        """Get the player's unique id, generating a UUID on first access."""
+        if self._player_id is None:
+            self._player_id = sys.intern(str(uuid.uuid4()))
+        return self._player_id
+
+    @player_id.setter
+    def player_id(self, player_id: str) -> None:
+        """
+        Set the player's id (e.g. when restoring a saved game).
+
+        Args:
+            player_id (str): The id to use for this player.
+        """
+        # Interned so lookups in the high score table, whose keys are interned
+        # too, match on identity instead of comparing 36 characters.
+        self._player_id = sys.intern(player_id)
 
     @property
     def name(self) -> str:
@@ -1,8 +1,11 @@
+import functools
+
 from src.core.player import Player
 from src.core.dice_hand import DiceHand
 from src.core.die import Die
 from src.core.histogram import Histogram
 from src.core.high_score import HighScore
+from src.core.simulate import Strategy, simulate_games
 
 from src.managers import (
     StateManager,
@@ -22,7 +25,21 @@ class Game:
     It replaces the old 'god class' structure.
     """
 
-    def __init__(self, player1: Player = None, winning_score: int = 100):
+    __slots__ = (
+        "state_manager",
+        "stats_manager",
+        "persistence_manager",
+        "move_manager",
+        "setup_manager",
+    )
+
+    def __init__(
+        self,
+        player1: Player = None,
+        winning_score: int = 100,
+        use_fast_rng: bool = False,
+        verbose: bool = True,
+    ):
         dice_hand = DiceHand([Die(6)])
         save_manager = SaveManager()
         cheat_manager = CheatManager()
@@ -33,7 +50,12 @@ class Game:
         self.stats_manager = StatsManager(highscore=highscore, histogram=histogram)
         self.persistence_manager = PersistenceManager(self.state_manager, save_manager)
         self.move_manager = MoveManager(
-            self.state_manager, self.stats_manager, cheat_manager, dice_hand
+            self.state_manager,
+            self.stats_manager,
+            cheat_manager,
+            dice_hand,
+            use_fast_rng=use_fast_rng,
+            verbose=verbose,
         )
         self.setup_manager = GameSetupManager(self.state_manager)
 
@@ -41,15 +63,32 @@ class Game:
             self.state_manager.player1 = player1
             self.state_manager.current_player = player1
 
+    @classmethod
+    def simulate_batch(
+        cls, n_games: int, strategy1: Strategy, strategy2: Strategy
+    ) -> list:
+        """Simulates many games between two strategies without UI or managers."""
+        return simulate_games(n_games, strategy1, strategy2)
+
     def roll_dice(self) -> int:
         return self.move_manager.roll_dice()
 
     def hold(self) -> str:
         return self.move_manager.hold()
 
+    def is_valid_move(self, move: str) -> bool:
+        return self.move_manager.is_valid_move(move)
+
+    def execute_move(self, move: str) -> tuple:
+        return self.move_manager.execute_move(move)
+
     def execute_computer_turn(self) -> str:
         return self.move_manager.execute_computer_turn()
 
+    @property
+    def has_active_session(self) -> bool:
+        return self.state_manager.has_active_session
+
     def restart(self) -> None:
         return self.move_manager.restart_game()
 
@@ -86,9 +125,21 @@ class Game:
     def input_cheat_code(self, cheat_code: str) -> str:
         return self.move_manager.apply_cheat(cheat_code)
 
+    def get_game_state(self) -> dict:
+        return self.state_manager.get_game_state()
+
+    def game_hash(self) -> int:
+        return self.state_manager.game_hash()
+
     def get_game_history_summary(self) -> str:
         return self.stats_manager.get_game_history_summary()
 
+    def get_dice_history(self) -> list:
+        return self.stats_manager.get_dice_history()
+
+    def dice_history_view(self) -> memoryview:
+        return self.stats_manager.dice_history_view()
+
     def get_dice_history_summary(self) -> str:
         return self.stats_manager.get_dice_history_summary()
 
@@ -104,6 +155,33 @@ class Game:
     def clear_high_scores(self) -> str:
         return self.stats_manager.clear_high_scores()
 
+    def flush_high_scores(self) -> None:
+        return self.stats_manager.flush()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _prefix(player1_name: str, player2_name: str) -> str:
+        """Builds (and caches) the invariant player part of the string form."""
+        return f"Game(player1={player1_name}, player2={player2_name}, "
+
+    def _names(self) -> tuple:
+        player1 = self.player1.name if self.player1 else None
+        player2 = self.player2.name if self.player2 else "Computer"
+        return player1, player2
+
+    def __str__(self) -> str:
+        return (
+            self._prefix(*self._names())
+            + f"turn_score={self.turn_score}, game_over={self.game_over})"
+        )
+
+    def __repr__(self) -> str:
+        return (
+            self._prefix(*self._names())
+            + f"turn_score={self.turn_score}, game_over={self.game_over}, "
+            f"winning_score={self.winning_score})"
+        )
+
     @property
     def current_player(self):
         return self.state_manager.current_player
@@ -140,6 +218,10 @@ class Game:
     def current_difficulty(self):
         return self.state_manager.current_difficulty
 
+    @property
+    def current_difficulty_title(self):
+        return self.state_manager.current_difficulty_title
+
     @property
     def winner(self):
         return self.state_manager.winner
@@ -57,7 +57,7 @@ class GameHandlers:
             if self.cli.game.game_over:
                 self.cli._current_state = STATE_GAME_OVER
                 self.cli.show_game_over()
-            elif self.cli.game._current_player is None and not self.cli.game.game_over:
+            elif self.cli.game.current_player is None and not self.cli.game.game_over:
                 self.cli.do_computer_turn("")
         except ValueError as e:
             print(ROLL_ERROR.format(e))
@@ -135,7 +135,7 @@ class GameHandlers:
 
     def handle_computer_turn(self) -> None:
         """Handle computer turn."""
-        if not self.cli.game or self.cli.game._player2 is not None:
+        if not self.cli.game or self.cli.game.player2 is not None:
             return
 
         try:
@@ -160,8 +160,7 @@ class GameHandlers:
 
         if (
             self.cli._current_state != STATE_PLAYING
-            and not self.cli.game._turn_history
-            and not self.cli.game._dice_history
+            and not self.cli.game.has_active_session
         ):
             print(NO_ACTIVE_GAME)
             return
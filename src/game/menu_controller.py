@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
 from src.constants import *
 from src.game.menu_system import MenuSystem  # The original MenuSystem (View)
 
@@ -14,54 +14,97 @@ class MenuController:
     It manages the flow of the CLI.
     """
 
+    # Upper bound on remembered menu screens; the cache is simply emptied when full.
+    MENU_CACHE_SIZE = 32
+    # Number of options in each fixed numbered menu. The difficulty menu is
+    # left out: its length varies and its handler reports bad choices itself.
+    MENU_CHOICE_COUNTS = {
+        STATE_MENU: 8,
+        STATE_SETTINGS: 4,
+        STATE_STATISTICS: 4,
+        STATE_HIGHSCORES: 4,
+    }
+
     def __init__(self, cli: "PigGameCLI", game: "Game"):
         """Initialize with reference to the CLI and the Game facade."""
         self.cli = cli
         self.game = game
         self.menu_system = MenuSystem()
 
+        # Numbered input is routed by CLI state through this table.
+        # Note: STATE_PLAYING choices (Roll, Hold) are handled by do_roll/do_hold in CLI
+        self._menu_handlers = {
+            STATE_MENU: self._handle_main_menu_choice,
+            STATE_SETTINGS: self._handle_settings_choice,
+            STATE_DIFFICULTY: self._handle_difficulty_choice,
+            STATE_STATISTICS: self.handle_statistics_choice,
+            STATE_HIGHSCORES: self.handle_highscores_choice,
+        }
+        # Rendered menu screens, keyed by every value they display.
+        self._menu_cache: Dict[Tuple, str] = {}
+
+    def _render_menu(self, key: Tuple, render: Callable[[], str]) -> str:
+        """Returns the menu text for key, calling render() only on a cache miss."""
+        text = self._menu_cache.get(key)
+        if text is None:
+            if len(self._menu_cache) >= self.MENU_CACHE_SIZE:
+                self._menu_cache.clear()
+            text = self._menu_cache[key] = render()
+        return text
+
     def show_main_menu(self) -> None:
         """Shows the main menu."""
         print(MAIN_MENU)
 
     def show_settings_menu(self) -> None:
         """Shows the settings menu."""
+        current_difficulty = self.game.current_difficulty
+        player1_name = self.game.player1.name if self.game.player1 else "N/A"
         p2_info = self._get_player2_display_info()
         print(
-            self.menu_system.show_settings_menu(
-                current_difficulty=self.game.current_difficulty,
-                player1_name=self.game.player1.name if self.game.player1 else "N/A",
-                player2_info=p2_info,
+            self._render_menu(
+                (STATE_SETTINGS, current_difficulty, player1_name, p2_info),
+                lambda: self.menu_system.show_settings_menu(
+                    current_difficulty=current_difficulty,
+                    player1_name=player1_name,
+                    player2_info=p2_info,
+                ),
             )
         )
 
     def show_difficulty_menu(self) -> None:
         """Shows the difficulty selection menu."""
         difficulties = self.game.get_available_difficulties()
+        current_difficulty = self.game.current_difficulty
         print(
-            self.menu_system.show_difficulty_menu(
-                difficulties=difficulties,
-                current_difficulty=self.game.current_difficulty,
+            self._render_menu(
+                (STATE_DIFFICULTY, tuple(difficulties), current_difficulty),
+                lambda: self.menu_system.show_difficulty_menu(
+                    difficulties=difficulties,
+                    current_difficulty=current_difficulty,
+                ),
             )
         )
 
-    def show_game_status(self) -> None:
-        """Shows the in-game menu and current status."""
-        p2_info = self._get_player2_display_info()
-        p1_score = self.game.player1.current_score if self.game.player1 else 0
+    def show_game_status(self, state: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Shows the in-game menu and current status.
+
+        Args:
+            state (dict, optional): A get_game_state() snapshot the caller already
+                took for this action; taken here if not given.
+        """
+        if state is None:
+            state = self.game.get_game_state()
 
         print(
             self.menu_system.show_game_menu(
-                player1_name=(
-                    self.game.player1.name if self.game.player1 else "Player 1"
-                ),
-                player1_score=p1_score,
-                player2_info=p2_info,
-                current_player_name=(
-                    self.game.current_player.name if self.game.current_player else "N/A"
-                ),
-                turn_score=self.game.turn_score,
-                winning_score=self.game.winning_score,
+                player1_name=state["player1_name"] or "Player 1",
+                player1_score=state["player1_score"],
+                player2_info=self._get_player2_display_info(state),
+                current_player_name=state["current_player"] or "N/A",
+                turn_score=state["turn_score"],
+                winning_score=state["score_to_win"],
             )
         )
 
@@ -72,32 +115,33 @@ class MenuController:
 
     # --- Helper ---
 
-    def _get_player2_display_info(self) -> str:
+    def _get_player2_display_info(self, state: Optional[Dict[str, Any]] = None) -> str:
         """Helper to display P2 or Computer info consistently."""
+        if state is None:
+            state = self.game.get_game_state()
         if self.game.player2:
-            return f"Player 2 ({self.game.player2.name}): {self.game.player2.current_score} points"
-        else:
-            return f"Computer: {self.game.computer_score} points (Difficulty: {self.game.current_difficulty.title()})"
+            return (
+                f"Player 2 ({state['player2_name']}): "
+                f"{state['player2_score']} points"
+            )
+        return (
+            f"Computer: {state['player2_score']} points "
+            f"(Difficulty: {self.game.current_difficulty_title})"
+        )
 
     # --- Central Menu Input Handler ---
 
+    def accepts_choice(self, choice: int) -> bool:
+        """Returns True if the menu for the current CLI state handles choice."""
+        state = self.cli._current_state
+        if state == STATE_DIFFICULTY:
+            return True
+        return 1 <= choice <= self.MENU_CHOICE_COUNTS.get(state, 0)
+
     def handle_menu_input(self, choice: int) -> Optional[bool]:
         """Routes numbered choices based on the current CLI state."""
-        current_state = self.cli._current_state
-
-        if current_state == STATE_MENU:
-            return self._handle_main_menu_choice(choice)
-        elif current_state == STATE_SETTINGS:
-            return self._handle_settings_choice(choice)
-        elif current_state == STATE_DIFFICULTY:
-            return self._handle_difficulty_choice(choice)
-        elif current_state == STATE_STATISTICS:
-            return self.handle_statistics_choice(choice)
-        elif current_state == STATE_HIGHSCORES:
-            return self.handle_highscores_choice(choice)
-        # Note: STATE_PLAYING choices (Roll, Hold) are typically handled by do_roll/do_hold in CLI
-
-        return None
+        handler = self._menu_handlers.get(self.cli._current_state)
+        return handler(choice) if handler else None
 
     # --- Menu Choice Handlers (Logic) ---
 
@@ -119,10 +163,14 @@ class MenuController:
             self.cli._current_state = STATE_HIGHSCORES
             self._handle_high_scores_menu()
         elif choice == 7:
+            if not self.game.has_active_session:
+                print(NO_ACTIVE_GAME)
+                return None
             print(RESUMING_GAME)
             self.cli._current_state = STATE_PLAYING
             self.show_game_status()
         elif choice == 8:
+            self.game.flush_high_scores()
             print(THANKS_PLAYING_GAME)
             return True  # Signal CLI to quit
         return None
@@ -192,14 +240,15 @@ class MenuController:
         message = self.game.hold()
         print(message)
 
-        if self.game.game_over:
-            self.show_game_over()
+        state = self.game.get_game_state()
+        if state["game_over"]:
+            self.show_game_over(state)
             self.cli._current_state = STATE_MENU
             self.show_main_menu()
         elif self.game.current_player == self.game.computer_player:
             self.cli.do_computer_turn("")
         else:
-            self.show_game_status()
+            self.show_game_status(state)
 
     def handle_computer_turn(self) -> None:
         """Handles the computer's turn action."""
@@ -210,13 +259,14 @@ class MenuController:
         turn_message = self.game.execute_computer_turn()
         print(turn_message)
 
-        if self.game.game_over:
-            self.show_game_over()
+        state = self.game.get_game_state()
+        if state["game_over"]:
+            self.show_game_over(state)
             self.cli._current_state = STATE_MENU
             self.show_main_menu()
         else:
-            print(f"\n--- {self.game.current_player.name}'s TURN ---", end="")
-            self.show_game_status()
+            print(f"\n--- {state['current_player']}'s TURN ---", end="")
+            self.show_game_status(state)
 
     def _handle_statistics_menu(self) -> None:
         """Presents the statistics menu."""
@@ -374,15 +424,18 @@ class MenuController:
         print(result)
         self.show_settings_menu()
 
-    def show_game_over(self) -> None:
-        """Displays the game over message."""
-        winner = self.game.winner if self.game.winner else self.game.computer_player
+    def show_game_over(self, state: Optional[Dict[str, Any]] = None) -> None:
+        """Displays the game over message, from the given game state snapshot if any."""
+        if state is None:
+            state = self.game.get_game_state()
+        winner_name = state["winner"] or self.game.computer_player.name
 
-        print("\n" + "=" * 40)
-        print(f"{'🎉 GAME OVER! 🎉':^40}")
-        print(f"{f'{winner.name.upper()} WINS!':^40}")
-        print(f"{f'Final Score: {self.game.winning_score}':^40}")
-        print("=" * 40 + "\n")
+        print(
+            GAME_OVER_BANNER.format(
+                winner_line=f"{winner_name.upper()} WINS!",
+                score_line=f"Final Score: {state['score_to_win']}",
+            )
+        )
 
     def show_rules(self):
         print(self.menu_system.show_rules())
@@ -1,8 +1,30 @@
-from typing import List
+import string
+from typing import List, Optional, Tuple
 
 from src.constants import *
 
 
+def _split_template(template: str) -> Optional[Tuple[Tuple[str, Optional[str]], ...]]:
+    """
+    Splits a template into (literal text, field name) pairs, once.
+
+    Returns None if any field is not a plain {name} (positional, indexed, or
+    with a format spec or conversion), in which case the template has to go
+    through str.format after all.
+    """
+    parts = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if field is not None and (spec or conversion or not field.isidentifier()):
+            return None
+        parts.append((literal, field))
+    return tuple(parts)
+
+
+# The in-game menu is redrawn after every roll and hold, so its template is
+# parsed here at import rather than by str.format on each redraw.
+_GAME_MENU_PARTS = _split_template(GAME_MENU_TEMPLATE)
+
+
 class MenuSystem:
     """Handles all menu display and navigation logic."""
 
@@ -24,13 +46,21 @@ class MenuSystem:
         winning_score: int,
     ) -> str:
         """Display the in-game menu during gameplay."""
-        return GAME_MENU_TEMPLATE.format(
-            player1_name=player1_name,
-            player1_score=player1_score,
-            player2_info=player2_info,
-            current_player_name=current_player_name,
-            turn_score=turn_score,
-            winning_score=winning_score,
+        values = {
+            "player1_name": player1_name,
+            "player1_score": player1_score,
+            "player2_info": player2_info,
+            "current_player_name": current_player_name,
+            "turn_score": turn_score,
+            "winning_score": winning_score,
+        }
+        if _GAME_MENU_PARTS is None:
+            return GAME_MENU_TEMPLATE.format_map(values)
+        return "".join(
+            [
+                literal if field is None else literal + str(values[field])
+                for literal, field in _GAME_MENU_PARTS
+            ]
         )
 
     def show_settings_menu(
@@ -47,16 +77,15 @@ class MenuSystem:
         self, difficulties: List[str], current_difficulty: str
     ) -> str:
         """Display the difficulty selection menu."""
-        difficulty_options = []
-        for i, diff in enumerate(difficulties):
-            marker = (
-                DIFFICULTY_CURRENT_MARKER
-                if diff.lower() == current_difficulty.lower()
-                else ""
-            )
-            difficulty_options.append(f"{i + 1}. {diff.title()}{marker}")
-
-        options_text = "\n".join(difficulty_options)
+        current = current_difficulty.lower()
+        # A list comprehension, not a generator: str.join builds a list anyway.
+        options_text = "\n".join(
+            [
+                f"{i}. {diff.title()}"
+                f"{DIFFICULTY_CURRENT_MARKER if diff.lower() == current else ''}"
+                for i, diff in enumerate(difficulties, 1)
+            ]
+        )
         max_choice = len(difficulties) + 1
 
         return DIFFICULTY_MENU_TEMPLATE.format(
@@ -5,13 +5,23 @@ This module contains the PigGameCLI class that implements a command-line interfa
 using Python's cmd module for the terminal-based Pig dice game.
 """
 
+import atexit
 import cmd
-from typing import Optional
+import os
+from typing import List, Optional
 from src.core.player import Player
 from src.game.game import Game
 from src.game.menu_controller import MenuController
 from src.constants import *
 
+try:
+    import readline
+except ImportError:  # Not available on every platform (e.g. plain Windows)
+    readline = None
+
+HISTORY_FILE = os.path.join(os.path.dirname(__file__), "..", "data", "cli_history")
+HISTORY_LENGTH = 500
+
 
 class PigGameCLI(cmd.Cmd):
     """Command-line interface for the Pig Dice Game."""
@@ -33,24 +43,80 @@ class PigGameCLI(cmd.Cmd):
         # NOTE: Assuming Game initialization arguments are correct
         self.game = Game(self.player1, DEFAULT_WINNING_SCORE)
         self.menu_controller = MenuController(self, self.game)
-
-        # Dynamically create do_1 through do_7 methods for MENU selections ONLY
-        for i in range(1, 8):
-            setattr(self, f"do_{i}", self._create_menu_handler(i))
-
-    def _create_menu_handler(self, choice: int):
+        # Short aliases that cmd.Cmd cannot map to a do_* method on its own.
+        self._aliases = {
+            "r": self.do_roll,
+            "h": self.do_hold,
+            "b": self.do_back,
+            "q": self.do_quit,
+        }
+        # cmd.Cmd rescans dir(self.__class__) on every Tab; the commands never change.
+        self._command_names: List[str] = sorted(
+            name[3:] for name in self.get_names() if name.startswith("do_")
+        )
+
+    def preloop(self):
+        """Restore line-editing history and save it again when the program exits."""
+        if readline is None:
+            return
+        readline.set_history_length(HISTORY_LENGTH)
+        try:
+            readline.read_history_file(HISTORY_FILE)
+        except OSError:
+            pass  # No history yet
+        atexit.register(self._write_history)
+
+    def _write_history(self) -> None:
+        try:
+            readline.write_history_file(HISTORY_FILE)
+        except OSError:
+            pass
+
+    def completenames(self, text, *ignored):
+        """Complete command names, e.g. 'ro<Tab>' -> 'roll'."""
+        return [name for name in self._command_names if name.startswith(text)]
+
+    def _choose(self, choice: int) -> Optional[bool]:
         """
-        Creates a dynamic handler for numbered inputs (1, 2, 3, etc.).
-        This handler is now ONLY for MENU navigation (non-STATE_PLAYING states).
+        Routes a numbered input (1, 2, 3, etc.) to the menu for the current state.
+        Numbers are ONLY for MENU navigation (non-STATE_PLAYING states), and
+        only those the current menu lists; anything else is an unknown command.
         """
+        if not self._accepts_choice(choice):
+            print(UNKNOWN_COMMAND.format(choice))
+            return None
+        return self.menu_controller.handle_menu_input(choice)
+
+    def _accepts_choice(self, choice: int) -> bool:
+        """Returns True if the current state has a menu option numbered choice."""
+        return self._current_state != STATE_PLAYING and (
+            self.menu_controller.accepts_choice(choice)
+        )
+
+    # Named do_N commands so cmd.Cmd lists and completes them; all share _choose.
+    def do_1(self, args):
+        return self._choose(1)
+
+    def do_2(self, args):
+        return self._choose(2)
 
-        def handler(args):
-            if self._current_state == STATE_PLAYING:
-                print(UNKNOWN_COMMAND.format(choice))
-            else:
-                return self.menu_controller.handle_menu_input(choice)
+    def do_3(self, args):
+        return self._choose(3)
 
-        return handler
+    def do_4(self, args):
+        return self._choose(4)
+
+    def do_5(self, args):
+        return self._choose(5)
+
+    def do_6(self, args):
+        return self._choose(6)
+
+    def do_7(self, args):
+        return self._choose(7)
+
+    def do_8(self, args):
+        return self._choose(8)
 
     def do_start(self, args):
         """Opens the main menu to begin game setup (MenuController handles flow)."""
@@ -115,6 +181,7 @@ class PigGameCLI(cmd.Cmd):
 
     def do_quit(self, args):
         """Exit the game."""
+        self.game.flush_high_scores()
         print(THANKS_PLAYING_GAME)
         return True
 
@@ -135,28 +202,29 @@ class PigGameCLI(cmd.Cmd):
         print("Please use the Settings menu (option 5) to load the game.")
 
     def do_resume(self, args):
-        """Inform user about resuming."""
-        if self._current_state == STATE_PLAYING:
+        """Return to the game in progress, if there is one."""
+        if self.game.has_active_session:
+            self._current_state = STATE_PLAYING
             self.do_status(None)
         else:
-            print("No active game to resume. Please start a new game or load a save.")
+            print(NO_ACTIVE_GAME)
 
     # --- CMD Fallback ---
 
     def default(self, line):
-        """Handle unknown commands or try to interpret digits as menu choices."""
+        """Handle short aliases, digits as menu choices, and unknown commands."""
         line = line.strip()
-        if line.isdigit():
-            choice = int(line)
-            # Route numbers 1-7 to the dynamic handler for menu navigation
-            if 1 <= choice <= 7 and hasattr(self, f"do_{choice}"):
-                getattr(self, f"do_{choice}")(None)
-            else:
-                # If it's a number outside the main menu range, treat as unknown
-                print(UNKNOWN_COMMAND.format(line))
-        else:
-            # Catch all other unknown commands
-            print(UNKNOWN_COMMAND.format(line))
+        handler = self._aliases.get(line)
+        if handler is None and len(line) == 1:
+            # Aliases are single letters, so only those need case folding
+            handler = self._aliases.get(line.lower())
+        if handler is not None:
+            return handler("")
+        if line.isdigit() and self._accepts_choice(int(line)):
+            # e.g. " 3" or "05"; the same menu router as do_1..do_8
+            return self._choose(int(line))
+        # Catch all other unknown commands
+        print(UNKNOWN_COMMAND.format(line))
 
     def emptyline(self):
         """Do nothing on empty input."""
@@ -1,12 +1,18 @@
 from src.core.player import Player
+from src.constants import CHEAT_CODES
 from typing import Tuple, Any
 
 
-# Assuming src.constants.CHEAT_CODES is available
-
-
 class CheatManager:
-    # ... (init, get_cheat_codes, get_cheat_code remain the same)
+    # Static help text, shared by every instance instead of rebuilt per call.
+    CHEAT_HELP: str = CHEAT_CODES
+    # Total-score and turn-score cheats and the points each one adds.
+    TOTAL_SCORE_BONUSES = {"BONUS5": 5, "BONUS15": 15}
+    TURN_SCORE_BONUSES = {"SCORE10": 10, "SCORE25": 25}
+
+    def get_cheat_codes(self) -> str:
+        """Returns the help text listing all available cheat codes."""
+        return self.CHEAT_HELP
 
     # Redefined apply_cheat to use the StateManager concept
     def apply_cheat(
@@ -40,24 +46,18 @@ class CheatManager:
                 f"Cheat applied! Hold to win",
             )
 
-        elif code == "BONUS5":
-            player.add_to_score(5)
-            return (
-                True,
-                f"Cheat applied! Added 5 points. {player.name} now has {player.current_score} points.",
-            )
-
-        elif code == "BONUS15":
-            player.add_to_score(15)
+        elif code in self.TOTAL_SCORE_BONUSES:
+            bonus = self.TOTAL_SCORE_BONUSES[code]
+            player.add_to_score(bonus)
             return (
                 True,
-                f"Cheat applied! Added 15 points. {player.name} now has {player.current_score} points.",
+                f"Cheat applied! Added {bonus} points. {player.name} now has {player.current_score} points.",
             )
 
         # --- Cheats affecting turn score (need StateManager access) ---
-        elif code in ["SCORE10", "SCORE25"]:
+        elif code in self.TURN_SCORE_BONUSES:
             if state_manager is not None:
-                add_score = 10 if code == "SCORE10" else 25
+                add_score = self.TURN_SCORE_BONUSES[code]
                 # Directly update the turn score property of the StateManager
                 state_manager.turn_score += add_score
                 return (
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 from src.core.player import Player
 from src.core.intelligence import DiceDifficulty
@@ -14,7 +15,11 @@ class GameSetupManager:
 
     def __init__(self, state_manager: "StateManager"):
         self._state = state_manager
-        self._dice_difficulty = DiceDifficulty()
+
+    @cached_property
+    def _dice_difficulty(self) -> DiceDifficulty:
+        """Difficulty catalogue, built the first time it is needed."""
+        return DiceDifficulty()
 
     def set_player_name(self, name: str) -> bool:
         """Sets or updates Player 1's name."""
@@ -1,7 +1,10 @@
-from typing import TYPE_CHECKING
+import random
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, List, Tuple
 from src.core.dice_hand import DiceHand
 from src.core.intelligence import DiceDifficulty
 from src.core.player import Player
+from src.constants import GAME_RULES
 
 if TYPE_CHECKING:
     from .state_manager import StateManager
@@ -15,26 +18,55 @@ class MoveManager:
     computer turns, and applying cheats.
     """
 
+    ROLL_BUFFER_SIZE = 4096
+    RULES: str = GAME_RULES
+    VALID_MOVES = frozenset({"roll", "r", "hold", "h"})
+    ROLL_MOVES = frozenset({"roll", "r"})
+
     def __init__(
         self,
         state_manager: "StateManager",
         stats_manager: "StatsManager",
         cheat_manager: "CheatManager",
         dice_hand: DiceHand,
+        use_fast_rng: bool = False,
+        verbose: bool = True,
     ):
         self._state = state_manager
         self._stats = stats_manager
         self._cheats = cheat_manager
         self._dice_hand = dice_hand
-        self._dice_difficulty = DiceDifficulty()  # used for AI strategy
+        self._verbose = verbose
+
+        # Optional pre-generated rolls for simulation/self-play loops.
+        self._use_fast_rng = use_fast_rng
+        self._roll_buffer: List[int] = []
+        self._roll_idx: int = 0
+
+    @cached_property
+    def _dice_difficulty(self) -> DiceDifficulty:
+        """AI strategy, built on the first computer turn."""
+        return DiceDifficulty(verbose=self._verbose)
+
+    def _refill_rolls(self) -> None:
+        """Refills the roll buffer with a fresh batch of die rolls."""
+        faces = range(1, self._dice_hand.dice[0].sides + 1)
+        self._roll_buffer = random.choices(faces, k=self.ROLL_BUFFER_SIZE)
+        self._roll_idx = 0
 
     def roll_dice(self) -> int:
         """Rolls the dice, updates turn score, and checks for a bust."""
         if self._state.game_over or self._state.current_player is None:
             return 0
 
-        roll_results = self._dice_hand.roll_all()
-        roll_value = roll_results[0]  # assuming only one die in DiceHand for simplicity
+        if self._use_fast_rng:
+            if self._roll_idx >= len(self._roll_buffer):
+                self._refill_rolls()
+            roll_value = self._roll_buffer[self._roll_idx]
+            self._roll_idx += 1
+        else:
+            # assuming only one die in DiceHand for simplicity
+            roll_value = self._dice_hand.roll_all()[0]
 
         self._stats.record_roll(roll_value)
 
@@ -48,20 +80,23 @@ class MoveManager:
 
     def hold(self) -> str:
         """Holds the turn, adds turn score to total score, and switches player."""
-        if self._state.game_over or self._state.current_player is None:
+        state = self._state
+        current_player = state.current_player
+        if state.game_over or current_player is None:
             return "Cannot hold: game is over or not started."
 
-        score_to_add = self._state.turn_score
-        current_player = self._state.current_player
+        score_to_add = state.turn_score
 
-        if current_player == self._state.computer_player:
-            self._state.computer_score += score_to_add
+        if current_player is state.computer_player:
+            total_score = state.computer_score + score_to_add
+            state.computer_score = total_score
         else:
             current_player.add_to_score(score_to_add)
+            total_score = current_player.current_score
 
-        self._stats.record_turn(current_player.player_id, score_to_add)
+        self._stats.record_turn(current_player.player_id, score_to_add, total_score)
 
-        self._state.turn_score = 0
+        state.turn_score = 0
 
         if self._check_win_condition(current_player):
             return f"{current_player.name} wins!"
@@ -69,28 +104,53 @@ class MoveManager:
             self._end_turn()
             return f"{current_player.name} held {score_to_add} points."
 
-    def execute_computer_turn(self) -> str:
-        """Executes the computer's turn using the current difficulty strategy."""
-        current_difficulty = self._state.current_difficulty
-        turn_bust = False
+    def is_valid_move(self, move: str) -> bool:
+        """Checks whether a textual move can be played right now."""
+        return not self._state.game_over and move.lower().strip() in self.VALID_MOVES
 
-        try:
-            computer_turn_score = self._dice_difficulty.roll(current_difficulty)
+    def execute_move(self, move: str) -> Tuple[str, Any]:
+        """
+        Plays a textual move ('roll'/'r' or 'hold'/'h').
 
-            if computer_turn_score == 1:
-                turn_bust = True
+        Returns:
+            Tuple[str, Any]: A status message and the rolled value (for a roll)
+            or the same message (for a hold).
 
+        Raises:
+            ValueError: If the move is unknown or the game is over.
+        """
+        normalized = move.lower().strip()
+        if self._state.game_over or normalized not in self.VALID_MOVES:
+            raise ValueError(f"Invalid move: {move}")
+
+        if normalized in self.ROLL_MOVES:
+            roll_value = self.roll_dice()
+            if roll_value == 1:
+                return "Rolled a 1! Turn score lost.", roll_value
+            return f"Turn score: {self._state.turn_score}", roll_value
+
+        message = self.hold()
+        return message, message
+
+    def execute_computer_turn(self) -> str:
+        """Executes the computer's turn using the current difficulty strategy."""
+        ai = self._dice_difficulty
+        # Quiet games (simulations, self-play) have no per-roll output to show,
+        # so the whole turn is drawn in one batch.
+        play_turn = ai.roll if self._verbose else ai.roll_fast
+        try:
+            computer_turn_score = play_turn(self._state.current_difficulty)
         except ValueError as e:
             return f"AI Error: {e}"
 
-        if turn_bust:
+        if computer_turn_score == 1:
             self._state.turn_score = 0
             self._end_turn()
             return "Computer rolled a 1 and busted!"
-        else:
-            self._state.turn_score = computer_turn_score
-            hold_message = self.hold()
-            return f"Computer rolled for a total of {computer_turn_score} and held. {hold_message}"
+
+        self._state.turn_score = computer_turn_score
+        hold_message = self.hold()
+        return f"Computer rolled for a total of {computer_turn_score} and held. {hold_message}"
 
     def _end_turn(self) -> None:
         """Handles the necessary steps at the end of a player's turn (bust or hold)."""
@@ -118,6 +178,10 @@ class MoveManager:
             return True
         return False
 
+    def get_rules(self) -> str:
+        """Returns the static rules text."""
+        return self.RULES
+
     def restart_game(self) -> None:
         """Resets the game state for a fresh start with existing players."""
         self._state.reset_for_new_game()
@@ -15,8 +15,7 @@ class SaveManager:
             saves_dir (str): Directory to store save files.
         """
         self._saves_dir = saves_dir
-        if not os.path.exists(self._saves_dir):
-            os.makedirs(self._saves_dir)
+        os.makedirs(self._saves_dir, exist_ok=True)
 
     def save_game(self, game_state: Dict[str, Any], filename: str = None) -> str:
         """
@@ -36,8 +35,15 @@ class SaveManager:
 
             filepath = os.path.join(self._saves_dir, filename)
 
-            with open(filepath, "w") as f:
-                json.dump(game_state, f, indent=2)
+            # json.dump() with an indent writes chunk by chunk; dumps() builds
+            # the whole document first so the file takes a single write.
+            payload = json.dumps(game_state, indent=2)
+            # Write a sibling temp file and swap it in, so an interrupted save
+            # never leaves a truncated save file behind.
+            tmp_path = filepath + ".tmp"
+            with open(tmp_path, "w") as f:
+                f.write(payload)
+            os.replace(tmp_path, filepath)
 
             return f"Game saved successfully to '{filename}'!"
 
@@ -57,12 +63,14 @@ class SaveManager:
         try:
             filepath = os.path.join(self._saves_dir, filename)
 
-            if not os.path.exists(filepath):
+            try:
+                # json.dumps() output is ASCII, so the raw bytes go straight to
+                # json.loads() without a text-layer decode.
+                with open(filepath, "rb") as f:
+                    save_data = json.loads(f.read())
+            except FileNotFoundError:
                 return None, f"Save file '{filename}' not found."
 
-            with open(filepath, "r") as f:
-                save_data = json.load(f)
-
             return save_data, f"Game loaded successfully from '{filename}'!"
 
         except Exception as e:
@@ -75,12 +83,17 @@ class SaveManager:
         Returns:
             List[str]: List of save filenames.
         """
-        if not os.path.exists(self._saves_dir):
+        try:
+            # scandir's entries know their file type from the directory read
+            # itself, so stray sub-directories are skipped without a stat().
+            with os.scandir(self._saves_dir) as entries:
+                save_files = [
+                    entry.name
+                    for entry in entries
+                    if entry.name.endswith(".json") and entry.is_file()
+                ]
+        except FileNotFoundError:
             return []
 
-        save_files = []
-        for filename in os.listdir(self._saves_dir):
-            if filename.endswith(".json"):
-                save_files.append(filename)
-
+        # Timestamped names sort chronologically, so reverse order is newest first.
         return sorted(save_files, reverse=True)
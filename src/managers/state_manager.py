@@ -1,4 +1,6 @@
-from typing import Optional, Dict, Any
+import functools
+import random
+from typing import Optional, Dict, Any, Tuple
 from src.core.player import Player
 from src.constants import (
     DEFAULT_WINNING_SCORE,
@@ -6,30 +8,79 @@ from src.constants import (
 )  # Assuming these exist
 
 
+@functools.lru_cache(maxsize=None)
+def _zobrist_tables(winning_score: int) -> Tuple[tuple, tuple, tuple, tuple]:
+    """
+    Builds the Zobrist key tables for a given winning score.
+
+    One random 64-bit key per possible value of player 1's score, the
+    opponent's score, the turn score and the current seat (0, 1 or none).
+    A fixed seed keeps hashes stable between runs.
+    """
+    rng = random.Random(42)
+    size = winning_score + 1
+
+    def column(length: int) -> tuple:
+        return tuple(rng.getrandbits(64) for _ in range(length))
+
+    return column(size), column(size), column(size), column(3)
+
+
 class StateManager:
     """
     Manages the current state of the Pig Dice Game.
     It is the single source of truth for all mutable game data.
     """
 
+    __slots__ = (
+        "_player1",
+        "_player2",
+        "_current_player_idx",
+        "_turn_score",
+        "_game_over",
+        "_session_active",
+        "_winner",
+        "_computer_won",
+        "_winning_score",
+        "_current_difficulty",
+        "_current_difficulty_title",
+        "computer_player",
+        "_computer_score",
+        "_players",
+    )
+
+    # (computer_score, turn_score, game_over, winner, computer_won) at game start.
+    _NEW_GAME_STATE = (0, 0, False, None, False)
+
     def __init__(self, winning_score: int = DEFAULT_WINNING_SCORE):
         self._player1: Optional[Player] = None
         self._player2: Optional[Player] = (
             None  # can be a human Player or None for computer mode
         )
 
-        self._current_player: Optional[Player] = None
+        # Seats are (player1, player2-or-computer); the current player is an
+        # index into that tuple so switching turns is a single XOR.
+        self._current_player_idx: Optional[int] = None
         self._turn_score: int = 0
         self._game_over: bool = False
+        # True from the start of a game until it is over, so "resume" is a flag read.
+        self._session_active: bool = False
         self._winner: Optional[Player] = None
         self._computer_won: bool = False
 
         self._winning_score: int = winning_score
         self._current_difficulty: str = DEFAULT_DIFFICULTY
+        self._current_difficulty_title: str = DEFAULT_DIFFICULTY.title()
 
         self.computer_player = Player("Computer")
         self.computer_player.player_id = "computer"
         self._computer_score: int = 0
+        self._players: tuple = (None, self.computer_player)
+
+    def _update_seats(self) -> None:
+        """Rebuilds the seat tuple after player1 or player2 changes."""
+        opponent = self._player2 if self._player2 is not None else self.computer_player
+        self._players = (self._player1, opponent)
 
     @property
     def player1(self) -> Optional[Player]:
@@ -38,6 +89,7 @@ class StateManager:
     @player1.setter
     def player1(self, player: Player) -> None:
         self._player1 = player
+        self._update_seats()
 
     @property
     def player2(self) -> Optional[Player]:
@@ -46,14 +98,24 @@ class StateManager:
     @player2.setter
     def player2(self, player: Optional[Player]) -> None:
         self._player2 = player
+        self._update_seats()
 
     @property
     def current_player(self) -> Optional[Player]:
-        return self._current_player
+        if self._current_player_idx is None:
+            return None
+        return self._players[self._current_player_idx]
 
     @current_player.setter
     def current_player(self, player: Optional[Player]) -> None:
-        self._current_player = player
+        if player is None:
+            self._current_player_idx = None
+        elif player is self._players[0]:
+            self._current_player_idx = 0
+        elif player is self._players[1]:
+            self._current_player_idx = 1
+        else:
+            raise ValueError("Current player must be one of the seated players.")
 
     @property
     def turn_score(self) -> int:
@@ -70,6 +132,11 @@ class StateManager:
     @game_over.setter
     def game_over(self, status: bool) -> None:
         self._game_over = status
+        self._session_active = not status
+
+    @property
+    def has_active_session(self) -> bool:
+        return self._session_active
 
     @property
     def winner(self) -> Optional[Player]:
@@ -106,27 +173,72 @@ class StateManager:
     @current_difficulty.setter
     def current_difficulty(self, difficulty: str) -> None:
         self._current_difficulty = difficulty.lower()
+        self._current_difficulty_title = self._current_difficulty.title()
+
+    @property
+    def current_difficulty_title(self) -> str:
+        """The current difficulty formatted for display, cached on change."""
+        return self._current_difficulty_title
 
     def switch_player(self) -> Optional[Player]:
         """Switches the current player between player1 and player2/computer."""
         if self._player1 is None:
             return None  # Should not happen in a running game
 
-        if self._player2 is not None:
-            # Player vs Player
-            self._current_player = (
-                self._player2
-                if self._current_player == self._player1
-                else self._player1
-            )
-        else:
-            # Player vs Computer
-            if self._current_player == self._player1:
-                self._current_player = self.computer_player
-            elif self._current_player == self.computer_player:
-                self._current_player = self._player1
+        # Seat 1 is player 2 or the computer, so both modes share one toggle.
+        if self._current_player_idx is not None:
+            self._current_player_idx ^= 1
 
-        return self._current_player
+        return self.current_player
+
+    def get_game_state(self) -> Dict[str, Any]:
+        """Returns a snapshot of the values shown in the game status display."""
+        player1, opponent = self._players
+        current = self.current_player
+        return {
+            "player1_name": player1.name if player1 else None,
+            "player1_score": player1.current_score if player1 else 0,
+            "player2_name": opponent.name,
+            "player2_score": (
+                self._computer_score
+                if opponent is self.computer_player
+                else opponent.current_score
+            ),
+            "current_player": current.name if current else None,
+            "turn_score": self._turn_score,
+            "game_over": self._game_over,
+            "winner": (
+                self.computer_player.name
+                if self._computer_won
+                else (self._winner.name if self._winner else None)
+            ),
+            "score_to_win": self._winning_score,
+        }
+
+    def game_hash(self) -> int:
+        """
+        Returns a Zobrist hash of (scores, turn score, current seat).
+
+        Identical positions always hash to the same key, so AI lookahead can
+        cache results per position. Values at or above the winning score are
+        folded into one slot, since such positions are already decided.
+        """
+        p1_keys, p2_keys, turn_keys, seat_keys = _zobrist_tables(self._winning_score)
+        cap = self._winning_score
+        player1, opponent = self._players
+        p1_score = player1.current_score if player1 else 0
+        p2_score = (
+            self._computer_score
+            if opponent is self.computer_player
+            else opponent.current_score
+        )
+        seat = 2 if self._current_player_idx is None else self._current_player_idx
+        return (
+            p1_keys[min(p1_score, cap)]
+            ^ p2_keys[min(p2_score, cap)]
+            ^ turn_keys[min(self._turn_score, cap)]
+            ^ seat_keys[seat]
+        )
 
     def get_state_for_save(self) -> Dict[str, Any]:
         """Returns a dict containing all state data suitable for serialization."""
@@ -144,7 +256,7 @@ class StateManager:
             "current_difficulty": self._current_difficulty,
             "is_vs_computer": self._player2 is None,
             "current_player_name": (
-                self._current_player.name if self._current_player else None
+                self.current_player.name if self.current_player else None
             ),
         }
 
@@ -154,11 +266,14 @@ class StateManager:
             self._player1.reset_score()
         if self._player2:
             self._player2.reset_score()
-        self._computer_score = 0
-        self._turn_score = 0
-        self._game_over = False
-        self._winner = None
-        self._computer_won = False
+        (
+            self._computer_score,
+            self._turn_score,
+            self._game_over,
+            self._winner,
+            self._computer_won,
+        ) = self._NEW_GAME_STATE
+        self._session_active = True
 
         if self._player1:
-            self._current_player = self._player1
+            self._current_player_idx = 0
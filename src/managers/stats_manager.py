@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, Dict, Any, List, Optional
+from array import array
+from typing import TYPE_CHECKING, Dict, Any, List, NamedTuple, Optional
 from src.core.histogram import Histogram
 from src.core.high_score import HighScore
 from src.core.player import Player
@@ -7,6 +8,14 @@ if TYPE_CHECKING:
     from .state_manager import StateManager
 
 
+class TurnRecord(NamedTuple):
+    """A single completed turn: who played it, what it scored, and the new total."""
+
+    player: str
+    turn_score: int
+    total_score: int
+
+
 class StatsManager:
     """
     Manages all game history, dice roll history, and high-score reporting.
@@ -17,14 +26,73 @@ class StatsManager:
         self._highscore = highscore
         self._histogram = histogram
         self._game_history: List[Dict[str, Any]] = []
+        # Die faces fit in a signed byte, so store them unboxed.
+        self._dice_history = array("b")
+        # Rolls only go into the history; the histogram is brought up to date
+        # from it when read, and this counts how many rolls it already holds.
+        self._histogram_synced = 0
+
+        # Turn history is stored column-wise: one compact array per field,
+        # with player ids replaced by a small index into _turn_player_ids.
+        self._turn_player_ids: List[str] = []
+        self._turn_player_index: Dict[str, int] = {}
+        self._turn_player = array("I")
+        self._turn_scores = array("H")
+        self._turn_totals = array("H")
 
     def record_roll(self, roll_value: int) -> None:
-        """Records a single dice roll for the Histogram."""
-        self._histogram.add(roll_value)
-
-    def record_turn(self, player_id: str, turn_score: int) -> None:
+        """Records a single dice roll in the roll history."""
+        self._dice_history.append(roll_value)
+
+    def record_rolls(self, roll_values: List[int]) -> None:
+        """Records a batch of dice rolls, e.g. a whole DiceHand.roll_all() result."""
+        self._dice_history.extend(roll_values)
+
+    @property
+    def histogram(self) -> Histogram:
+        """The dice roll Histogram, including every roll recorded so far."""
+        history = self._dice_history
+        if self._histogram_synced < len(history):
+            self._histogram.add_many(history[self._histogram_synced :])
+            self._histogram_synced = len(history)
+        return self._histogram
+
+    def get_dice_history(self) -> List[int]:
+        """Returns a list copy of every roll recorded so far, in order."""
+        return self._dice_history.tolist()
+
+    def dice_history_view(self) -> memoryview:
+        """
+        Returns a read-only view of the recorded rolls, without copying them.
+
+        The history cannot grow while a view is held, so release() it (or use
+        it in a ``with`` block) before any further rolls are recorded.
+        """
+        return memoryview(self._dice_history).toreadonly()
+
+    def record_turn(
+        self, player_id: str, turn_score: int, total_score: int = 0
+    ) -> None:
         """Records the final score of a completed turn."""
-        pass
+        idx = self._turn_player_index.get(player_id)
+        if idx is None:
+            idx = len(self._turn_player_ids)
+            self._turn_player_ids.append(player_id)
+            self._turn_player_index[player_id] = idx
+        self._turn_player.append(idx)
+        self._turn_scores.append(turn_score)
+        self._turn_totals.append(total_score)
+
+    @property
+    def turn_history(self) -> List[TurnRecord]:
+        """Returns the recorded turns as TurnRecords, built only when requested."""
+        ids = self._turn_player_ids
+        return [
+            TurnRecord(ids[idx], score, total)
+            for idx, score, total in zip(
+                self._turn_player, self._turn_scores, self._turn_totals
+            )
+        ]
 
     def record_game(self, state_manager: "StateManager") -> None:
         """Records the results of a completed game in HighScore and game history."""
@@ -81,7 +149,7 @@ class StatsManager:
 
     def get_dice_history_summary(self) -> str:
         """Returns the formatted dice roll histogram string."""
-        return self._histogram.get_string(title="Dice Roll Frequencies")
+        return self.histogram.get_string(title="Dice Roll Frequencies")
 
     def get_player_statistics_summary(self) -> str:
         """Returns the full player statistics string from HighScore."""
@@ -91,6 +159,10 @@ class StatsManager:
         """Returns the top player scores string from HighScore."""
         return self._highscore.get_top_players_string()
 
+    def flush(self) -> None:
+        """Writes any pending high score changes to disk."""
+        self._highscore.flush()
+
     def clear_high_scores(self) -> str:
         """Clears high scores via the HighScore object."""
         return self._highscore.clear_high_scores()
@@ -2,90 +2,139 @@
 Display utilities for the Pig Dice Game CLI.
 
 This module contains all display-related functionality separated from the main CLI class for better organization.
+Each screen is a plain function taking the CLI instance, e.g. ``show_game_status(cli)``.
 """
 
-from src.constants import *
+from src.constants import (
+    ACTIVE_GAME_NOTE,
+    CURRENT_PLAYER_FORMAT,
+    DIFFICULTY_MENU_COMMANDS,
+    GAME_COMMANDS,
+    GAME_HELP,
+    GAME_NOT_INITIALIZED,
+    GAME_OVER_HEADER,
+    GAME_STATUS_HEADER,
+    GENERAL_HELP,
+    MAIN_MENU_COMMANDS,
+    MAIN_MENU_HELP,
+    PLAYER2_SCORE_FORMAT,
+    PLAYER_SCORE_FORMAT,
+    SCORE_TO_WIN_FORMAT,
+    SETTINGS_MENU_COMMANDS,
+    STATE_MENU,
+    STATE_PLAYING,
+    TURN_SCORE_FORMAT,
+    WINNER_DISPLAY,
+)
+
+# Help text per CLI state; any other state falls back to GENERAL_HELP.
+_HELP_BY_STATE = {STATE_PLAYING: GAME_HELP, STATE_MENU: MAIN_MENU_HELP}
+
+# Fixed text appended after each menu's dynamic part, joined once at import.
+_MAIN_MENU_TAIL = f"\n{MAIN_MENU_COMMANDS}"
+_ACTIVE_MAIN_MENU_TAIL = f"\n{ACTIVE_GAME_NOTE}{_MAIN_MENU_TAIL}"
+_SETTINGS_MENU_TAIL = f"\n{SETTINGS_MENU_COMMANDS}"
+_DIFFICULTY_MENU_TAIL = f"\n{DIFFICULTY_MENU_COMMANDS}"
+
+
+def show_main_menu(cli) -> None:
+    """Display the main menu with active game note if applicable."""
+    game = cli.game
+
+    # Cheapest checks first; has_active_session is a flag kept by the game,
+    # so no history needs inspecting on each redraw.
+    if (
+        game
+        and not game.game_over
+        and (cli._current_state == STATE_PLAYING or game.has_active_session)
+    ):
+        tail = _ACTIVE_MAIN_MENU_TAIL
+    else:
+        tail = _MAIN_MENU_TAIL
+    print(game.show_main_menu() + tail)
+
+
+def show_settings_menu(cli) -> None:
+    """Display the settings menu."""
+    print(cli.game.show_settings_menu() + _SETTINGS_MENU_TAIL)
+
+
+def show_difficulty_menu(cli) -> None:
+    """Display the difficulty selection menu."""
+    print(cli.game.show_difficulty_menu() + _DIFFICULTY_MENU_TAIL)
+
+
+def show_game_status(cli) -> None:
+    """Display the current game status including player scores and turn information."""
+    game = cli.game
+    if game is None:
+        print(GAME_NOT_INITIALIZED)
+        return
+
+    game_state = game.get_game_state()
+    p2_name = game_state["player2_name"]
+    lines = [
+        GAME_STATUS_HEADER,
+        PLAYER_SCORE_FORMAT.format(
+            game_state["player1_name"], game_state["player1_score"]
+        ),
+    ]
+    if p2_name:
+        lines.append(PLAYER2_SCORE_FORMAT.format(p2_name, game_state["player2_score"]))
+    lines += [
+        CURRENT_PLAYER_FORMAT.format(game_state["current_player"]),
+        TURN_SCORE_FORMAT.format(game_state["turn_score"]),
+        SCORE_TO_WIN_FORMAT.format(game_state["score_to_win"]),
+        GAME_COMMANDS,
+    ]
+    # Joined and printed once, so the screen is a single write.
+    print("\n".join(lines))
+
+
+def show_game_over(cli) -> None:
+    """Display the game over screen with the winner."""
+    game = cli.game
+    if game is None:
+        print(GAME_NOT_INITIALIZED)
+        return
+
+    winner = game.get_game_state()["winner"]
+    print(f"{GAME_OVER_HEADER}\n{WINNER_DISPLAY.format(winner)}\n{GAME_COMMANDS}")
+
+
+def show_help(cli) -> None:
+    """Display context-sensitive help information."""
+    print(_HELP_BY_STATE.get(cli._current_state, GENERAL_HELP))
 
 
 class DisplayUtils:
-    """Handles all display operations for the Pig Dice Game CLI."""
+    """
+    Object wrapper kept for callers that hold a display instance.
+
+    Each method forwards to the module-level function of the same name,
+    which takes the CLI directly.
+    """
+
+    __slots__ = ("cli",)
 
     def __init__(self, cli):
         """Initialize with reference to the CLI instance."""
         self.cli = cli
 
     def show_main_menu(self) -> None:
-        """Display the main menu with active game note if applicable."""
-        print(self.cli.game.show_main_menu())
-
-        if (
-            self.cli.game
-            and not self.cli.game.game_over
-            and (
-                self.cli._current_state == STATE_PLAYING
-                or self.cli.game._turn_history
-                or self.cli.game._dice_history
-            )
-        ):
-            print(ACTIVE_GAME_NOTE)
-
-        print(MAIN_MENU_COMMANDS)
+        show_main_menu(self.cli)
 
     def show_settings_menu(self) -> None:
-        """Display the settings menu."""
-        print(self.cli.game.show_settings_menu())
-        print(SETTINGS_MENU_COMMANDS)
+        show_settings_menu(self.cli)
 
     def show_difficulty_menu(self) -> None:
-        """Display the difficulty selection menu."""
-        print(self.cli.game.show_difficulty_menu())
-        print(DIFFICULTY_MENU_COMMANDS)
+        show_difficulty_menu(self.cli)
 
     def show_game_status(self) -> None:
-        """Display the current game status including player scores and turn information."""
-        if not self.cli.game:
-            print(GAME_NOT_INITIALIZED)
-            return
-
-        game_state = self.cli.game.get_game_state()
-
-        print(GAME_STATUS_HEADER)
-        print(
-            PLAYER_SCORE_FORMAT.format(
-                game_state["player1_name"], game_state["player1_score"]
-            )
-        )
-
-        if game_state["player2_name"]:
-            print(
-                PLAYER2_SCORE_FORMAT.format(
-                    game_state["player2_name"], game_state["player2_score"]
-                )
-            )
-
-        print(CURRENT_PLAYER_FORMAT.format(game_state["current_player"]))
-        print(TURN_SCORE_FORMAT.format(game_state["turn_score"]))
-        print(SCORE_TO_WIN_FORMAT.format(game_state["score_to_win"]))
-        print(GAME_COMMANDS)
+        show_game_status(self.cli)
 
     def show_game_over(self) -> None:
-        """Display the game over screen with the winner."""
-        if not self.cli.game:
-            print(GAME_NOT_INITIALIZED)
-            return
-
-        game_state = self.cli.game.get_game_state()
-        winner = game_state["winner"]
-
-        print(GAME_OVER_HEADER)
-        print(WINNER_DISPLAY.format(winner))
-        print(GAME_COMMANDS)
+        show_game_over(self.cli)
 
     def show_help(self) -> None:
-        """Display context-sensitive help information."""
-        if self.cli._current_state == STATE_PLAYING:
-            print(GAME_HELP)
-        elif self.cli._current_state == STATE_MENU:
-            print(MAIN_MENU_HELP)
-        else:
-            print(GENERAL_HELP)
+        show_help(self.cli)
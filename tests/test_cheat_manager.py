@@ -243,3 +243,31 @@ def test_apply_cheat_trimming(cheat_manager, test_player):
 
     assert success is True
     assert test_player.current_score == initial_score + 5
+
+
+def test_real_cheat_manager_turn_score_bonus(test_player):
+    """The real CheatManager adds the mapped bonus to the turn score."""
+    from src.managers.cheat_manager import CheatManager as RealCheatManager
+
+    state = MockStateManager(initial_turn_score=5)
+    success, message = RealCheatManager().apply_cheat(
+        " score25 ", test_player, 100, state_manager=state
+    )
+    assert success is True
+    assert state.turn_score == 30
+    assert "Added 25 to turn score" in message
+
+
+@pytest.mark.parametrize("code, bonus", [("BONUS5", 5), ("bonus15", 15)])
+def test_real_total_score_bonus_cheats(code, bonus, test_player):
+    """The real CheatManager adds each total-score bonus from its table."""
+    from src.managers.cheat_manager import CheatManager as RealCheatManager
+
+    success, message = RealCheatManager().apply_cheat(code, test_player, 100)
+
+    assert success is True
+    assert test_player.current_score == 50 + bonus
+    assert message == (
+        f"Cheat applied! Added {bonus} points. "
+        f"TestUser now has {50 + bonus} points."
+    )
@@ -38,3 +38,22 @@ def test_total_without_rolling_raises():
     hand = DiceHand([Die(6)])
     with pytest.raises(RuntimeError):
         hand.total
+
+
+def test_roll_all_respects_each_die_sides(monkeypatch):
+    calls = []
+    monkeypatch.setattr("random.randint", lambda a, b: calls.append((a, b)) or b)
+
+    hand = DiceHand([Die(6), Die(8), Die(20)])
+    assert hand.roll_all() == [6, 8, 20]
+    assert calls == [(1, 6), (1, 8), (1, 20)]
+
+
+def test_total_is_computed_once_per_roll(monkeypatch):
+    monkeypatch.setattr("random.randint", lambda a, b: 3)
+    hand = DiceHand([Die(6), Die(6), Die(6)])
+    hand.roll_all()
+
+    monkeypatch.setattr("builtins.sum", lambda values: pytest.fail("re-summed"))
+    assert hand.total == 9
+    assert hand.total == 9
@@ -22,3 +22,13 @@ def test_die_roll_value_type():
     die = Die()
     value = die.roll()
     assert type(value) == int
+
+
+def test_die_roll_matches_randint_for_same_seed():
+    import random
+
+    die = Die(6)
+    random.seed(1234)
+    rolls = [die.roll() for _ in range(50)]
+    random.seed(1234)
+    assert rolls == [random.randint(1, 6) for _ in range(50)]
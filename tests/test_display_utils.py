@@ -1,3 +1,9 @@
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.utils import display_utils
+from src.utils.display_utils import DisplayUtils
+
 # """
 # Unit tests for the DisplayUtils class, focusing on verifying that the correct
 # information is formatted and printed based on the CLI and Game states.
@@ -255,3 +261,134 @@
 #     mock_cli._current_state = "some_other_state"
 #     display_utils.show_help()
 #     mock_print.assert_called_once_with(mock_constants_display.GENERAL_HELP)
+
+
+# ----------------------------------------------------------------------
+# Tests against the current DisplayUtils
+# ----------------------------------------------------------------------
+
+
+@pytest.fixture
+def status_cli():
+    """A mocked CLI whose game reports a two-player game state."""
+    cli = MagicMock()
+    cli.game.get_game_state.return_value = {
+        "player1_name": "Ann",
+        "player1_score": 12,
+        "player2_name": "Ben",
+        "player2_score": 30,
+        "current_player": "Ben",
+        "turn_score": 4,
+        "score_to_win": 100,
+        "winner": None,
+        "game_over": False,
+    }
+    return cli
+
+
+def test_show_game_status_prints_once(status_cli):
+    """The whole status block is emitted with a single print call."""
+    with patch("builtins.print") as mock_print:
+        display_utils.show_game_status(status_cli)
+
+    mock_print.assert_called_once()
+    output = mock_print.call_args.args[0]
+    assert "Ann" in output and "Ben" in output and "30" in output
+
+
+def test_show_game_status_matches_format_constants(status_cli):
+    """The inlined f-strings render exactly what the *_FORMAT constants would."""
+    from src.constants import (
+        CURRENT_PLAYER_FORMAT,
+        PLAYER2_SCORE_FORMAT,
+        PLAYER_SCORE_FORMAT,
+        SCORE_TO_WIN_FORMAT,
+        TURN_SCORE_FORMAT,
+    )
+
+    with patch("builtins.print") as mock_print:
+        display_utils.show_game_status(status_cli)
+
+    lines = mock_print.call_args.args[0].split("\n")
+    assert PLAYER_SCORE_FORMAT.format("Ann", 12) in lines
+    assert PLAYER2_SCORE_FORMAT.format("Ben", 30) in lines
+    assert CURRENT_PLAYER_FORMAT.format("Ben") in lines
+    assert TURN_SCORE_FORMAT.format(4) in lines
+    assert SCORE_TO_WIN_FORMAT.format(100) in lines
+
+
+@pytest.mark.parametrize("active, expected", [(True, True), (False, False)])
+def test_show_main_menu_active_note_follows_session(active, expected):
+    """The active-game note depends on the game's session flag, not its history."""
+    from src.constants import ACTIVE_GAME_NOTE, STATE_MENU
+
+    cli = MagicMock()
+    cli._current_state = STATE_MENU
+    cli.game.game_over = False
+    cli.game.has_active_session = active
+    cli.game.show_main_menu.return_value = "MAIN"
+
+    with patch("builtins.print") as mock_print:
+        display_utils.show_main_menu(cli)
+
+    assert (ACTIVE_GAME_NOTE in mock_print.call_args.args[0]) is expected
+
+
+def test_show_help_uses_state_table():
+    """Help text is looked up by state, with GENERAL_HELP for unknown states."""
+    from src.constants import GAME_HELP, GENERAL_HELP, MAIN_MENU_HELP
+    from src.constants import STATE_MENU, STATE_PLAYING
+
+    cli = MagicMock()
+    for state, expected in (
+        (STATE_PLAYING, GAME_HELP),
+        (STATE_MENU, MAIN_MENU_HELP),
+        ("some_other_state", GENERAL_HELP),
+    ):
+        cli._current_state = state
+        with patch("builtins.print") as mock_print:
+            display_utils.show_help(cli)
+        mock_print.assert_called_once_with(expected)
+
+
+def test_display_utils_uses_slots():
+    """DisplayUtils keeps only its CLI reference and has no instance __dict__."""
+    display = DisplayUtils(MagicMock())
+    assert not hasattr(display, "__dict__")
+    with pytest.raises(AttributeError):
+        display.other = 1
+
+
+def test_display_utils_wrapper_forwards_to_functions(status_cli):
+    """The DisplayUtils wrapper prints exactly what the module function prints."""
+    with patch("builtins.print") as mock_print:
+        display_utils.show_game_status(status_cli)
+        DisplayUtils(status_cli).show_game_status()
+
+    first, second = mock_print.call_args_list
+    assert first == second
+
+
+def test_show_game_status_without_player2(status_cli):
+    """With no second player the status block has no blank line in its place."""
+    status_cli.game.get_game_state.return_value["player2_name"] = None
+
+    with patch("builtins.print") as mock_print:
+        display_utils.show_game_status(status_cli)
+
+    lines = mock_print.call_args.args[0].split("\n")
+    assert "" not in lines[1:3]
+    assert not any("Ben" in line and "points" in line for line in lines)
+
+
+@pytest.mark.parametrize("screen", ["show_game_status", "show_game_over"])
+def test_screens_without_game_print_not_initialized(screen):
+    """A CLI with no game prints the not-initialized message and nothing else."""
+    from src.constants import GAME_NOT_INITIALIZED
+
+    cli = MagicMock()
+    cli.game = None
+    with patch("builtins.print") as mock_print:
+        getattr(display_utils, screen)(cli)
+
+    mock_print.assert_called_once_with(GAME_NOT_INITIALIZED)
@@ -344,3 +344,46 @@ def test_winner_property_delegates_to_state_manager(mocked_game_components):
     mock_state.winner = "PlayerOne"
 
     assert m["game_instance"].winner == "PlayerOne"
+
+def test_simulate_batch_delegates_to_simulate_games():
+    """Test Game.simulate_batch() runs without a Game instance via simulate_games."""
+    from src.game.game import Game
+
+    with patch(f"{GAME_MODULE_PATH}.simulate_games", return_value=[0, 1]) as mock_sim:
+        assert Game.simulate_batch(2, 20, 25) == [0, 1]
+    mock_sim.assert_called_once_with(2, 20, 25)
+
+def test_get_game_state_delegates_to_state_manager(mocked_game_components):
+    """Test game.get_game_state() calls state_manager.get_game_state()."""
+    m = mocked_game_components
+    m["state_manager_mock"].get_game_state.return_value = {"turn_score": 3}
+
+    assert m["game_instance"].get_game_state() == {"turn_score": 3}
+
+def test_execute_move_delegates_to_move_manager(mocked_game_components):
+    """Test game.execute_move() calls move_manager.execute_move()."""
+    game = mocked_game_components["game_instance"]
+    mock_move = mocked_game_components["move_manager_mock"]
+    game.execute_move("roll")
+    mock_move.execute_move.assert_called_once_with("roll")
+
+def test_str_and_repr_include_players_and_state(mocked_game_components):
+    """Test str()/repr() combine the cached player prefix with live state."""
+    m = mocked_game_components
+    mock_state = m["state_manager_mock"]
+    mock_state.player1.name = "Alice"
+    mock_state.player2 = None
+    mock_state.turn_score = 8
+    mock_state.game_over = False
+    mock_state.winning_score = 150
+
+    game = m["game_instance"]
+    assert str(game) == "Game(player1=Alice, player2=Computer, turn_score=8, game_over=False)"
+    assert repr(game).endswith("game_over=False, winning_score=150)")
+
+def test_game_uses_slots(mocked_game_components):
+    """Test Game instances have no per-instance __dict__."""
+    game = mocked_game_components["game_instance"]
+    assert not hasattr(game, "__dict__")
+    with pytest.raises(AttributeError):
+        game.unexpected_attribute = 1
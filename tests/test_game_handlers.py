@@ -1,3 +1,6 @@
+import pytest
+from unittest.mock import MagicMock, patch
+
 # from unittest.mock import patch, MagicMock
 #
 # import pytest
@@ -407,3 +410,39 @@
 #     handler.handle_resume()
 #     mock_print.assert_called_with(mock_cli.constants.GAME_NOT_INITIALIZED)
 #     mock_cli.show_game_status.assert_not_called()
+
+
+# ----------------------------------------------------------------------
+# Tests against the current GameHandlers and Game
+# ----------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def handlers_module():
+    """Import the handlers and Game without leaving src.game modules cached."""
+    with patch.dict("sys.modules"):
+        import src.game.game_handlers as module
+        from src.game.game import Game
+
+        yield module, Game
+
+
+@pytest.mark.parametrize("active, expect_resume", [(True, True), (False, False)])
+def test_handle_resume_uses_active_session(handlers_module, active, expect_resume):
+    """Resume checks the Game's session flag rather than its old history lists."""
+    module, Game = handlers_module
+    cli = MagicMock()
+    cli._current_state = module.STATE_MENU
+    cli.game = MagicMock(spec=Game)
+    cli.game.game_over = False
+    cli.game.has_active_session = active
+
+    with patch("builtins.print") as mock_print:
+        module.GameHandlers(cli).handle_resume()
+
+    if expect_resume:
+        assert cli._current_state == module.STATE_PLAYING
+        mock_print.assert_called_once_with(module.RESUMING_GAME)
+    else:
+        assert cli._current_state == module.STATE_MENU
+        mock_print.assert_called_once_with(module.NO_ACTIVE_GAME)
@@ -5,7 +5,12 @@ Unit tests for the HighScore class, adjusted to test existing public methods
 and their reliance on private helpers (e.g., _ensure_player).
 """
 
+import json
+import os
+import sys
+
 import pytest
+from unittest.mock import patch
 from src.core.high_score import HighScore
 
 
@@ -139,4 +144,255 @@ def test_get_scores_string_empty(temp_highscore):
 
 def test_get_top_players_string_empty(temp_highscore):
     """Test get_top_players_string when data is empty."""
-    assert "No player scores available." in temp_highscore.get_top_players_string()
\ No newline at end of file
+    assert "No player scores available." in temp_highscore.get_top_players_string()
+
+def test_get_scores_string_ranks_by_wins_then_average(temp_highscore):
+    """Player stats are ordered by wins, then by average score."""
+    a, b, c = DummyPlayer("a", "Ann"), DummyPlayer("b", "Ben"), DummyPlayer("c", "Cat")
+    temp_highscore.record_game(b, a, 100, 10)
+    temp_highscore.record_game(c, a, 100, 90)
+    temp_highscore.record_game(c, b, 100, 20)
+
+    output = temp_highscore.get_scores_string()
+    assert output.index("Cat") < output.index("Ben") < output.index("Ann")
+    assert " Cat                       |     2 |    2 |      0 | 100.0% | 100.0     | c" in output
+
+
+def test_list_top_limits_to_n(temp_highscore):
+    """list_top(n) returns only the n best players, best first."""
+    players = [DummyPlayer(f"id{i}", f"P{i}") for i in range(5)]
+    for i, winner in enumerate(players[1:], 1):
+        for _ in range(i):
+            temp_highscore.record_game(winner, players[0], 100, 0)
+
+    top = temp_highscore.list_top(n=2)
+    assert [pid for pid, _ in top] == ["id4", "id3"]
+
+
+def test_find_by_name_is_case_insensitive(tmp_path):
+    """find_by_name() finds new and reloaded players regardless of case."""
+    file_path = str(tmp_path / "highscore_names.json")
+    hs = HighScore(filename=file_path)
+    hs.record_game(DummyPlayer("p1", "Zoe"), DummyPlayer("p2", "Karl"), 100, 50)
+
+    pid, rec = hs.find_by_name("zOE")
+    assert pid == "p1"
+    assert rec["wins"] == 1
+    assert hs.find_by_name("nobody") == (None, None)
+
+    assert HighScore(filename=file_path).find_by_name("KARL")[0] == "p2"
+
+    hs.clear_high_scores()
+    assert hs.find_by_name("Zoe") == (None, None)
+
+
+def test_autosave_off_defers_writes_until_flush(tmp_path):
+    """With autosave disabled, records reach disk only on flush()."""
+    file_path = str(tmp_path / "highscore_batch.json")
+    hs = HighScore(filename=file_path, autosave=False)
+    for _ in range(3):
+        hs.record_game(DummyPlayer("p1", "Ann"), DummyPlayer("p2", "Ben"), 100, 10)
+
+    assert not os.path.exists(file_path)
+
+    hs.flush()
+    assert HighScore(filename=file_path).data["p1"]["wins"] == 3
+
+    mtime = os.path.getmtime(file_path)
+    hs.flush()
+    assert os.path.getmtime(file_path) == mtime
+
+
+def test_record_game_stamps_both_players_with_one_timestamp(temp_highscore):
+    """New records created by one game share the game's timestamp."""
+    temp_highscore.record_game(
+        DummyPlayer("p1", "Ann"), DummyPlayer("p2", "Ben"), 100, 10
+    )
+
+    w_rec, l_rec = temp_highscore.data["p1"], temp_highscore.data["p2"]
+    assert w_rec["created"] == w_rec["last_played"] == l_rec["created"]
+    assert l_rec["last_played"] == w_rec["last_played"]
+
+
+def test_missing_file_starts_empty_without_warning(tmp_path, capsys):
+    """A first run with no high score file loads silently as empty data."""
+    hs = HighScore(filename=str(tmp_path / "missing.json"))
+
+    assert hs.data == {}
+    assert capsys.readouterr().out == ""
+
+
+def test_get_top_players_string_rows(temp_highscore):
+    """Each ranked player gets one line, and the text ends with a newline."""
+    temp_highscore.record_game(
+        DummyPlayer("p1", "Ann"), DummyPlayer("p2", "Ben"), 100, 40
+    )
+    lines = temp_highscore.get_top_players_string().split("\n")
+
+    assert lines[1] == "=" * 70
+    assert lines[2].startswith(" 1. Ann ") and "Win%: 100.0%" in lines[2]
+    assert lines[3].startswith(" 2. Ben ") and "Avg:   40.0" in lines[3]
+    assert lines[4] == ""
+
+
+def test_save_skips_unchanged_data_and_leaves_no_temp_file(tmp_path):
+    """Saving identical data does not rewrite the file; saves go via a temp file."""
+    file_path = str(tmp_path / "highscore_atomic.json")
+    hs = HighScore(filename=file_path)
+    hs.record_game(DummyPlayer("p1", "Ann"), DummyPlayer("p2", "Ben"), 100, 10)
+    assert os.listdir(tmp_path) == ["highscore_atomic.json"]
+
+    reloaded = HighScore(filename=file_path)
+    with patch("src.core.high_score.os.replace") as mock_replace:
+        reloaded._save()
+    mock_replace.assert_not_called()
+
+
+def test_rankings_are_cached_until_next_game(temp_highscore):
+    """Repeated renders reuse the cached table; recording a game refreshes it."""
+    ann, ben = DummyPlayer("p1", "Ann"), DummyPlayer("p2", "Ben")
+    temp_highscore.record_game(ann, ben, 100, 10)
+
+    first = temp_highscore.get_top_players_string()
+    with patch("src.core.high_score.heapq.nlargest") as mock_nlargest:
+        assert temp_highscore.get_top_players_string() is first
+        assert temp_highscore.list_top()[0][0] == "p1"
+    mock_nlargest.assert_not_called()
+
+    temp_highscore.record_game(ben, ann, 100, 10)
+    temp_highscore.record_game(ben, ann, 100, 10)
+    assert temp_highscore.list_top()[0][0] == "p2"
+    assert temp_highscore.get_top_players_string() != first
+
+
+def test_records_store_winrate_and_average(tmp_path):
+    """record_game() keeps averages on the record; older files get them on load."""
+    file_path = str(tmp_path / "highscore_avg.json")
+    hs = HighScore(filename=file_path)
+    ann, ben = DummyPlayer("p1", "Ann"), DummyPlayer("p2", "Ben")
+    hs.record_game(ann, ben, 100, 30)
+    hs.record_game(ben, ann, 100, 50)
+
+    assert hs.data["p1"]["winrate"] == 0.5
+    assert hs.data["p1"]["avg_score"] == 75.0
+
+    with open(file_path, "w") as f:
+        f.write(
+            '{"old": {"name": "Old", "games_played": 4, "wins": 1, '
+            '"losses": 3, "total_score": 200}}'
+        )
+    legacy = HighScore(filename=file_path).data["old"]
+    assert (legacy["winrate"], legacy["avg_score"]) == (0.25, 50.0)
+
+
+def test_averages_are_not_saved(tmp_path):
+    """The derived averages stay in memory; the file holds only the totals."""
+    file_path = str(tmp_path / "hs.json")
+    hs = HighScore(filename=file_path)
+    hs.record_game(DummyPlayer("p1", "Ann"), DummyPlayer("p2", "Ben"), 100, 40)
+
+    with open(file_path) as f:
+        saved = json.load(f)
+
+    assert "winrate" not in saved["p1"] and "avg_score" not in saved["p1"]
+    assert HighScore(filename=file_path).data["p1"]["winrate"] == 1.0
+
+
+def test_load_drops_entries_that_are_not_records(tmp_path):
+    """A stray non-record entry is skipped instead of failing the load."""
+    file_path = str(tmp_path / "hs.json")
+    with open(file_path, "w") as f:
+        f.write('{"x": 5, "p1": {"name": "Ann", "games_played": 2, "wins": 1}}')
+
+    hs = HighScore(filename=file_path)
+
+    assert list(hs.data) == ["p1"]
+    assert hs.data["p1"]["winrate"] == 0.5
+
+
+def test_player_ids_are_interned(tmp_path):
+    """Record keys share identity with interned ids, both new and reloaded."""
+    file_path = str(tmp_path / "highscore_intern.json")
+    pid = "".join(["p", "1"])
+    hs = HighScore(filename=file_path)
+    hs.record_game(DummyPlayer(pid, "Ann"), DummyPlayer("p2", "Ben"), 100, 10)
+
+    for store in (hs.data, HighScore(filename=file_path).data):
+        assert next(k for k in store if k == pid) is sys.intern(pid)
+
+
+def test_data_directory_is_created_once(tmp_path):
+    """The data directory is made on construction, not again on each save."""
+    file_path = str(tmp_path / "nested" / "dir" / "highscore.json")
+    hs = HighScore(filename=file_path)
+    assert os.path.isdir(os.path.dirname(file_path))
+
+    with patch("src.core.high_score.os.makedirs") as mock_makedirs:
+        hs.record_game(DummyPlayer("p1", "Ann"), DummyPlayer("p2", "Ben"), 100, 10)
+    mock_makedirs.assert_not_called()
+    assert os.path.exists(file_path)
+
+
+def test_flush_every_batches_autosaves(tmp_path):
+    """With flush_every=N, the file is rewritten once per N recorded games."""
+    file_path = str(tmp_path / "highscore_every.json")
+    hs = HighScore(filename=file_path, flush_every=3)
+    ann, ben = DummyPlayer("p1", "Ann"), DummyPlayer("p2", "Ben")
+
+    with patch.object(hs, "_save", wraps=hs._save) as mock_save:
+        for _ in range(7):
+            hs.record_game(ann, ben, 100, 10)
+        assert mock_save.call_count == 2
+
+        hs.flush()
+        assert mock_save.call_count == 3
+    assert HighScore(filename=file_path).data["p1"]["wins"] == 7
+
+
+def test_flush_every_must_be_positive(tmp_path):
+    with pytest.raises(ValueError):
+        HighScore(filename=str(tmp_path / "hs.json"), flush_every=0)
+
+
+def test_saved_file_is_indented(tmp_path):
+    """The high score file is written as indented, human-readable JSON."""
+    file_path = str(tmp_path / "hs.json")
+    hs = HighScore(filename=file_path)
+    hs.record_game(DummyPlayer("p1", "Ann"), DummyPlayer("p2", "Ben"), 100, 40)
+
+    with open(file_path) as f:
+        content = f.read()
+
+    assert content == json.dumps(json.loads(content), indent=4)
+    assert content.count("\n") > len(hs.data)
+
+
+@pytest.mark.parametrize(
+    "kwargs, registered",
+    [({}, False), ({"autosave": False}, True), ({"flush_every": 2}, True)],
+)
+def test_exit_flush_registered_only_when_batching(tmp_path, kwargs, registered):
+    """Only batching instances are kept alive by an atexit flush hook."""
+    with patch("src.core.high_score.atexit.register") as register:
+        hs = HighScore(filename=str(tmp_path / "hs.json"), **kwargs)
+
+    if registered:
+        register.assert_called_once_with(hs.flush)
+    else:
+        register.assert_not_called()
+
+
+def test_failed_flush_keeps_changes_pending(tmp_path):
+    """A write error leaves the changes pending so the next flush retries."""
+    file_path = str(tmp_path / "hs.json")
+    hs = HighScore(filename=file_path, autosave=False)
+    hs.record_game(DummyPlayer("p1", "Ann"), DummyPlayer("p2", "Ben"), 100, 10)
+
+    with patch("src.core.high_score.os.replace", side_effect=OSError("disk full")):
+        hs.flush()
+    assert hs._pending == 1
+    assert not os.path.exists(file_path)
+
+    hs.flush()
+    assert hs._pending == 0
+    assert HighScore(filename=file_path).data["p1"]["wins"] == 1
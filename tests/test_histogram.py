@@ -66,4 +66,25 @@ def test_get_string_prints_bars_for_data(hist):
     assert "█" in output_string
     assert " 1:    1 | " + "█" * 14 + " (1)" in output_string
     assert " 2:    2 | " + "█" * 27 + " (2)" in output_string
-    assert " 5:    3 | " + "█" * 41 + " (3)" in output_string
\ No newline at end of file
+    assert " 5:    3 | " + "█" * 41 + " (3)" in output_string
+
+def test_values_outside_bucket_range_are_counted():
+    """Values beyond max_value (or negative) fall back to the overflow dict."""
+    hist = Histogram(max_value=6)
+    for v in [12, 3, -1, 12, 6]:
+        hist.add(v)
+
+    assert hist.get_data() == {3: 1, 6: 1, 12: 2, -1: 1}
+    output = hist.get_string()
+    assert output.index(" -1:") < output.index("  3:") < output.index(" 12:")
+
+
+def test_add_many_matches_repeated_add(hist):
+    """add_many() gives the same counts as one add() per value."""
+    rolls = [1, 6, 6, 3, 9, 6, 1]
+    hist.add_many(rolls)
+
+    single = Histogram()
+    for r in rolls:
+        single.add(r)
+    assert hist.get_data() == single.get_data() == {1: 2, 3: 1, 6: 3, 9: 1}
@@ -39,4 +39,47 @@ class TestDiceDifficulty(unittest.TestCase):
     @patch("random.choice", return_value=1)
     def test_roll_bust_rule(self, _):
         for mode in self.d.get_available_difficulties():
-            self.assertEqual(self.d.roll(mode), 1)
\ No newline at end of file
+            self.assertEqual(self.d.roll(mode), 1)
+
+    @patch("random.choice", return_value=4)
+    def test_roll_quiet_when_not_verbose(self, _):
+        quiet = DiceDifficulty(verbose=False)
+        with patch("builtins.print") as mock_print:
+            self.assertEqual(quiet.roll("noob"), 8)
+        mock_print.assert_not_called()
+
+    @patch("random.choice", return_value=2)
+    def test_roll_count_per_mode(self, _):
+        quiet = DiceDifficulty(verbose=False)
+        expected = {
+            "noob": 4,
+            "casual": 8,
+            "challenger": 12,
+            "veteran": 16,
+            "elite": 20,
+            "legendary": 24,
+        }
+        for mode, total in expected.items():
+            self.assertEqual(quiet.roll(mode.upper()), total)
+
+    def test_roll_batch_returns_faces(self):
+        rolls = self.d.roll_batch("Elite", 50)
+        self.assertEqual(len(rolls), 50)
+        self.assertTrue(all(1 <= r <= 6 for r in rolls))
+        with self.assertRaises(ValueError):
+            self.d.roll_batch("unknown", 3)
+
+    def test_roll_batch_legendary_favours_six(self):
+        rolls = self.d.roll_batch("legendary", 2000)
+        self.assertGreater(rolls.count(6), rolls.count(1) * 5)
+
+    @patch("random.choices", return_value=[3, 3, 1, 6])
+    def test_roll_fast_bust(self, _):
+        self.assertEqual(self.d.roll_fast("casual"), 1)
+
+    @patch("random.choices", return_value=[3, 3, 5, 6])
+    def test_roll_fast_total(self, mock_choices):
+        with patch("builtins.print") as mock_print:
+            self.assertEqual(self.d.roll_fast("casual"), 17)
+        mock_print.assert_not_called()
+        self.assertEqual(mock_choices.call_args.kwargs["k"], 4)
@@ -0,0 +1,103 @@
+"""
+Unit tests for the MenuController class, using mocked CLI and Game objects
+to verify how numbered menu input is routed.
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.constants import NO_ACTIVE_GAME, STATE_MENU, STATE_PLAYING, STATE_SETTINGS
+
+
+@pytest.fixture(scope="module")
+def MenuController():
+    """Import MenuController without leaving src.game modules cached for other tests."""
+    with patch.dict("sys.modules"):
+        from src.game.menu_controller import MenuController as MC
+
+        yield MC
+
+
+@pytest.fixture
+def controller(MenuController):
+    """A MenuController wired to mocked CLI and Game objects."""
+    cli = MagicMock()
+    cli._current_state = STATE_MENU
+    return MenuController(cli, MagicMock())
+
+
+def test_handle_menu_input_routes_by_state(controller):
+    """Numbered input goes to the handler registered for the current state."""
+    controller._menu_handlers[STATE_SETTINGS] = MagicMock(return_value=None)
+    controller.cli._current_state = STATE_SETTINGS
+
+    controller.handle_menu_input(2)
+    controller._menu_handlers[STATE_SETTINGS].assert_called_once_with(2)
+
+
+def test_handle_menu_input_ignores_states_without_menu(controller):
+    """States without a numbered menu (e.g. playing) return None."""
+    controller.cli._current_state = STATE_PLAYING
+    assert controller.handle_menu_input(1) is None
+
+
+def test_main_menu_exit_signals_quit(controller):
+    """Choosing Exit (8) from the main menu returns True to stop the CLI."""
+    with patch("builtins.print"):
+        assert controller.handle_menu_input(8) is True
+
+
+def test_show_game_over_prints_banner_once(controller, capsys):
+    """The game over banner is written in one print with centred lines."""
+    state = {"winner": "Ann", "score_to_win": 100}
+
+    with patch("builtins.print", wraps=print) as mock_print:
+        controller.show_game_over(state)
+
+    mock_print.assert_called_once()
+    lines = capsys.readouterr().out.split("\n")
+    assert lines[1] == "=" * 40
+    assert lines[3] == f"{'ANN WINS!':^40}"
+    assert lines[4] == f"{'Final Score: 100':^40}"
+
+
+def test_difficulty_menu_is_rendered_once_per_selection(controller):
+    """Re-showing an unchanged menu reuses the rendered text."""
+    controller.game.get_available_difficulties.return_value = ["easy", "hard"]
+    controller.game.current_difficulty = "easy"
+    controller.menu_system = MagicMock()
+    controller.menu_system.show_difficulty_menu.side_effect = lambda **kw: str(kw)
+
+    with patch("builtins.print"):
+        controller.show_difficulty_menu()
+        controller.show_difficulty_menu()
+        assert controller.menu_system.show_difficulty_menu.call_count == 1
+
+        controller.game.current_difficulty = "hard"
+        controller.show_difficulty_menu()
+        assert controller.menu_system.show_difficulty_menu.call_count == 2
+
+
+def test_resume_without_active_session_stays_in_menu(controller):
+    """Resume (7) does not enter the game when none is in progress."""
+    controller.game.has_active_session = False
+
+    with patch("builtins.print") as mock_print:
+        controller.handle_menu_input(7)
+
+    assert controller.cli._current_state == STATE_MENU
+    mock_print.assert_called_once_with(NO_ACTIVE_GAME)
+
+
+def test_hold_reads_game_state_once_for_display(controller):
+    """After a hold, one state snapshot drives the status display."""
+    state = {"game_over": False}
+    controller.game.game_over = False
+    controller.game.get_game_state.return_value = state
+    controller.show_game_status = MagicMock()
+
+    with patch("builtins.print"):
+        controller.handle_hold()
+
+    controller.game.get_game_state.assert_called_once_with()
+    controller.show_game_status.assert_called_once_with(state)
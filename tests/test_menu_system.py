@@ -208,3 +208,14 @@ def test_show_load_game_menu_with_files(menu_system):
     # Ensure numbering and content is correct
     assert "1. save_01.json" in result
     assert "2. auto_save.json" in result
+
+
+def test_split_template_only_accepts_plain_named_fields(MenuSystem):
+    """Templates are pre-split only when a plain join reproduces str.format."""
+    import sys
+
+    split = sys.modules[MenuSystem.__module__]._split_template
+    assert split("a {x} {{b}}") == (("a ", "x"), (" {", None), ("b}", None))
+    assert split("{x:>3}") is None
+    assert split("{x!r}") is None
+    assert split("{} {0}") is None
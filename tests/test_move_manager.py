@@ -0,0 +1,145 @@
+"""
+Unit tests for the MoveManager class, using a real StateManager and Player
+with mocked statistics so that no high score file is touched.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.core.dice_hand import DiceHand
+from src.core.die import Die
+from src.core.player import Player
+from src.managers.move_manager import MoveManager
+from src.managers.state_manager import StateManager
+
+
+@pytest.fixture
+def state():
+    """A StateManager with a human player 1 against the computer."""
+    state = StateManager(winning_score=100)
+    state.player1 = Player("Tester")
+    state.current_player = state.player1
+    return state
+
+
+def make_manager(state, **kwargs):
+    """Builds a MoveManager with mocked stats and cheat managers."""
+    return MoveManager(state, MagicMock(), MagicMock(), DiceHand([Die(6)]), **kwargs)
+
+
+def test_roll_dice_uses_dice_hand_by_default(state, monkeypatch):
+    """Without the fast RNG, rolls come from the DiceHand."""
+    monkeypatch.setattr("random.randint", lambda a, b: 4)
+    manager = make_manager(state)
+
+    assert manager.roll_dice() == 4
+    assert state.turn_score == 4
+
+
+def test_roll_dice_fast_rng_draws_from_buffer(state):
+    """With the fast RNG, rolls are consumed from the pre-generated buffer."""
+    manager = make_manager(state, use_fast_rng=True)
+    manager._roll_buffer = [3, 5]
+    manager._roll_idx = 0
+
+    assert manager.roll_dice() == 3
+    assert manager.roll_dice() == 5
+    assert state.turn_score == 8
+
+
+def test_roll_dice_fast_rng_refills_buffer(state):
+    """An exhausted buffer is refilled with valid die faces."""
+    manager = make_manager(state, use_fast_rng=True)
+
+    manager.roll_dice()
+    assert len(manager._roll_buffer) == MoveManager.ROLL_BUFFER_SIZE
+    assert manager._roll_idx == 1
+    assert set(manager._roll_buffer) <= {1, 2, 3, 4, 5, 6}
+
+
+def test_get_rules_returns_shared_rules_text(state):
+    """get_rules() returns the class-level rules constant."""
+    from src.constants import GAME_RULES
+
+    manager = make_manager(state)
+    assert manager.get_rules() is MoveManager.RULES
+    assert manager.get_rules() == GAME_RULES
+
+
+@pytest.mark.parametrize("move", ["roll", "R", " hold ", "h"])
+def test_is_valid_move_accepts_known_moves(state, move):
+    """Roll and hold moves are valid in any case and with surrounding spaces."""
+    assert make_manager(state).is_valid_move(move)
+
+
+def test_is_valid_move_rejects_unknown_or_finished(state):
+    """Unknown moves and moves after game over are invalid."""
+    manager = make_manager(state)
+    assert not manager.is_valid_move("jump")
+    state.game_over = True
+    assert not manager.is_valid_move("roll")
+
+
+def test_execute_move_roll_returns_message_and_value(state, monkeypatch):
+    """A roll returns the turn status and the rolled value."""
+    monkeypatch.setattr("random.randint", lambda a, b: 5)
+    message, value = make_manager(state).execute_move(" R ")
+    assert value == 5
+    assert message == "Turn score: 5"
+
+
+def test_execute_move_hold_banks_turn_score(state):
+    """A hold adds the turn score to the player's total."""
+    state.turn_score = 12
+    message, _ = make_manager(state).execute_move("hold")
+    assert state.player1.current_score == 12
+    assert "held 12 points" in message
+
+
+def test_execute_move_invalid_raises(state):
+    """An unknown move raises ValueError."""
+    with pytest.raises(ValueError):
+        make_manager(state).execute_move("jump")
+
+
+def test_execute_computer_turn_bust_switches_back(state):
+    """A computer bust scores nothing and hands the turn back to player 1."""
+    state.current_player = state.computer_player
+    manager = make_manager(state, verbose=False)
+    manager._dice_difficulty.roll_fast = MagicMock(return_value=1)
+
+    assert manager.execute_computer_turn() == "Computer rolled a 1 and busted!"
+    assert state.computer_score == 0
+    assert state.current_player is state.player1
+
+
+def test_execute_computer_turn_holds_total(state):
+    """A successful computer turn banks its total."""
+    state.current_player = state.computer_player
+    manager = make_manager(state, verbose=False)
+    manager._dice_difficulty.roll_fast = MagicMock(return_value=14)
+
+    message = manager.execute_computer_turn()
+    assert message.startswith("Computer rolled for a total of 14 and held.")
+    assert state.computer_score == 14
+
+
+def test_verbose_computer_turn_rolls_one_at_a_time(state):
+    """A verbose game plays the computer turn roll by roll, not in a batch."""
+    state.current_player = state.computer_player
+    manager = make_manager(state, verbose=True)
+    manager._dice_difficulty.roll = MagicMock(return_value=9)
+    manager._dice_difficulty.roll_fast = MagicMock()
+
+    manager.execute_computer_turn()
+    manager._dice_difficulty.roll.assert_called_once()
+    manager._dice_difficulty.roll_fast.assert_not_called()
+
+
+def test_dice_difficulty_built_lazily(state):
+    """The AI strategy object is only created when first used."""
+    manager = make_manager(state, verbose=False)
+    assert "_dice_difficulty" not in vars(manager)
+
+    assert manager._dice_difficulty.verbose is False
+    assert "_dice_difficulty" in vars(manager)
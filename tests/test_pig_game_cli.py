@@ -1,3 +1,6 @@
+import pytest
+from unittest.mock import MagicMock, patch
+
 # """
 # Unit tests for the PigGameCLI class in src.cli.cli.py.
 #
@@ -261,3 +264,87 @@
 #     with patch('builtins.print') as mock_print:
 #         cli_instance.emptyline()
 #         mock_print.assert_not_called()
+
+
+# ----------------------------------------------------------------------
+# Tests against the real CLI (constructed with a real Game)
+# ----------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def cli_module():
+    """Import the CLI module without leaving src.game modules cached for other tests."""
+    with patch.dict("sys.modules"):
+        import src.game.pig_game_cli as module
+
+        yield module
+
+
+def test_completenames_matches_command_prefix(cli_module):
+    """Tab completion offers every command that starts with the typed text."""
+    cli = cli_module.PigGameCLI()
+    assert cli.completenames("ro") == ["roll"]
+    assert cli.completenames("re") == ["restart", "resume"]
+    assert "quit" in cli.completenames("")
+
+
+def test_preloop_restores_history_and_saves_at_exit(cli_module):
+    """preloop() loads the history file and registers a writer for exit."""
+    cli = cli_module.PigGameCLI()
+    fake_readline = MagicMock()
+    fake_readline.read_history_file.side_effect = FileNotFoundError
+
+    with (
+        patch.object(cli_module, "readline", fake_readline),
+        patch.object(cli_module.atexit, "register") as register,
+    ):
+        cli.preloop()
+        register.call_args.args[0]()
+
+    fake_readline.read_history_file.assert_called_once_with(cli_module.HISTORY_FILE)
+    fake_readline.write_history_file.assert_called_once_with(cli_module.HISTORY_FILE)
+
+
+def test_default_routes_aliases_and_digits(cli_module):
+    """Single-letter aliases and digits are dispatched without the cmd parser."""
+    cli = cli_module.PigGameCLI()
+    cli.do_roll = MagicMock()
+    cli._aliases["r"] = cli.do_roll
+    cli._current_state = cli_module.STATE_MENU
+    cli._choose = MagicMock(return_value=True)
+
+    cli.default("R")
+    cli.do_roll.assert_called_once_with("")
+    assert cli.default(" 8 ") is True
+    cli._choose.assert_called_once_with(8)
+
+    with patch("builtins.print") as mock_print:
+        cli.default("xyz")
+    mock_print.assert_called_once_with(cli_module.UNKNOWN_COMMAND.format("xyz"))
+
+
+@pytest.mark.parametrize("line", ["9", "0", "42"])
+def test_default_reports_unhandled_menu_numbers(cli_module, line):
+    """Numbers the main menu does not list print the unknown-command message."""
+    cli = cli_module.PigGameCLI()
+    cli._current_state = cli_module.STATE_MENU
+    cli.menu_controller.handle_menu_input = MagicMock()
+
+    with patch("builtins.print") as mock_print:
+        assert cli.onecmd(line) is None
+
+    mock_print.assert_called_once_with(cli_module.UNKNOWN_COMMAND.format(line))
+    cli.menu_controller.handle_menu_input.assert_not_called()
+
+
+def test_choice_outside_submenu_is_unknown(cli_module):
+    """'8' quits from the main menu but is an unknown command in a 4-option menu."""
+    cli = cli_module.PigGameCLI()
+    cli._current_state = cli_module.STATE_STATISTICS
+    cli.menu_controller.handle_menu_input = MagicMock()
+
+    with patch("builtins.print") as mock_print:
+        assert cli.onecmd("8") is None
+
+    mock_print.assert_called_once_with(cli_module.UNKNOWN_COMMAND.format(8))
+    cli.menu_controller.handle_menu_input.assert_not_called()
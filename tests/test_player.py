@@ -147,4 +147,23 @@ def test_repr_representation(custom_player):
 def test_current_score_getter(custom_player):
     """Test the current_score getter property."""
     custom_player.add_to_score(100)
-    assert custom_player.current_score == 100
\ No newline at end of file
+    assert custom_player.current_score == 100
+
+
+def test_player_uses_slots():
+    """Players carry no per-instance __dict__."""
+    player = Player("Slim")
+    assert not hasattr(player, "__dict__")
+    with pytest.raises(AttributeError):
+        player.nickname = "S"
+
+
+def test_player_id_is_generated_lazily_and_stable():
+    """The UUID is only created when first read, then stays the same."""
+    player = Player("Lazy")
+    assert player._player_id is None
+    first = player.player_id
+    assert len(first) == 36 and player.player_id is first
+
+    player.player_id = "restored-id"
+    assert player.player_id == "restored-id"
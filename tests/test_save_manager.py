@@ -1,3 +1,8 @@
+import json
+import shutil
+
+from src.managers.save_manager import SaveManager
+
 # import os
 # import json
 # import pytest
@@ -246,3 +251,87 @@
 #         files = manager.list_save_files()
 #         assert files == []
 #         mock_os.listdir.assert_not_called()
+
+
+# ----------------------------------------------------------------------
+# Tests against the current SaveManager
+# ----------------------------------------------------------------------
+
+
+def test_save_game_writes_indented_json_once(tmp_path, monkeypatch):
+    """The save is one write of the same indented JSON json.dump would produce."""
+    state = {"player1": {"name": "Ann", "score": 12}, "dice_history": [3, 5, 6]}
+    manager = SaveManager(str(tmp_path))
+    writes = []
+    real_open = open
+
+    def tracking_open(*args, **kwargs):
+        handle = real_open(*args, **kwargs)
+        write = handle.write
+        handle.write = lambda data: writes.append(data) or write(data)
+        return handle
+
+    monkeypatch.setattr("builtins.open", tracking_open)
+    result = manager.save_game(state, "one.json")
+    monkeypatch.undo()
+
+    assert "one.json" in result
+    assert len(writes) == 1
+    assert (tmp_path / "one.json").read_text() == json.dumps(state, indent=2)
+
+
+def test_save_then_load_round_trips(tmp_path):
+    """A saved state loads back unchanged."""
+    state = {"winning_score": 100, "turn_history": [{"player": "Ann", "points": 8}]}
+    manager = SaveManager(str(tmp_path))
+    manager.save_game(state, "round.json")
+
+    loaded, message = manager.load_game("round.json")
+
+    assert loaded == state
+    assert "round.json" in message
+
+
+def test_failed_save_keeps_previous_file(tmp_path, monkeypatch):
+    """A save that fails mid-way leaves the existing save file intact."""
+    manager = SaveManager(str(tmp_path))
+    manager.save_game({"score": 1}, "slot.json")
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("src.managers.save_manager.os.replace", failing_replace)
+    result = manager.save_game({"score": 2}, "slot.json")
+
+    assert result.startswith("Failed to save game")
+    assert json.loads((tmp_path / "slot.json").read_text()) == {"score": 1}
+    assert manager.list_save_files() == ["slot.json"]
+
+
+def test_load_missing_save_reports_not_found(tmp_path):
+    """Loading a file that does not exist returns None and a not-found message."""
+    loaded, message = SaveManager(str(tmp_path)).load_game("missing.json")
+
+    assert loaded is None
+    assert message == "Save file 'missing.json' not found."
+
+
+def test_list_save_files_newest_first_and_missing_dir(tmp_path):
+    """Only .json files are listed, newest first; a missing dir lists nothing."""
+    saves = tmp_path / "saves"
+    manager = SaveManager(str(saves))
+    for name in (
+        "pig_game_save_20240101_000000.json",
+        "notes.txt",
+        "pig_game_save_20250101_000000.json",
+    ):
+        (saves / name).write_text("{}")
+    (saves / "old.json").mkdir()
+
+    assert manager.list_save_files() == [
+        "pig_game_save_20250101_000000.json",
+        "pig_game_save_20240101_000000.json",
+    ]
+
+    shutil.rmtree(saves)
+    assert manager.list_save_files() == []
@@ -0,0 +1,69 @@
+"""
+Unit tests for the Monte Carlo helpers in src.core.simulate.
+"""
+
+import random
+
+import pytest
+from src.core.simulate import simulate_games, simulate_turn_totals
+
+
+def test_simulate_games_returns_one_winner_per_game():
+    """Every simulated game should produce a winner index of 0 or 1."""
+    winners = simulate_games(50, 20, 20, rng=random.Random(1))
+    assert len(winners) == 50
+    assert set(winners) <= {0, 1}
+
+
+def test_simulate_games_is_reproducible_with_seeded_rng():
+    """The same seed should produce the same sequence of winners."""
+    first = simulate_games(30, 15, 25, rng=random.Random(42))
+    second = simulate_games(30, 15, 25, rng=random.Random(42))
+    assert first == second
+
+
+def test_simulate_games_accepts_callable_strategy():
+    """A callable strategy is consulted with (turn_score, own, opponent)."""
+    calls = []
+
+    def hold_at_ten(turn_score, own, opp):
+        calls.append((turn_score, own, opp))
+        return turn_score >= 10
+
+    simulate_games(5, hold_at_ten, 20, rng=random.Random(3))
+    assert calls
+    assert all(turn_score > 0 for turn_score, _, _ in calls)
+
+
+def test_simulate_games_never_rolling_one_lets_player1_win(monkeypatch):
+    """With no busts, player 1 always wins because it moves first."""
+    rng = random.Random()
+    monkeypatch.setattr(rng, "randint", lambda a, b: 6)
+    assert simulate_games(3, 20, 20, rng=rng) == [0, 0, 0]
+
+
+def test_simulate_games_rejects_invalid_strategy():
+    """A non-positive threshold is not a valid strategy."""
+    with pytest.raises(ValueError):
+        simulate_games(1, 0, 20)
+
+
+def test_simulate_games_rejects_bool_strategy():
+    """True is an int, but not a hold threshold."""
+    with pytest.raises(ValueError):
+        simulate_games(1, True, 20)
+
+
+def test_simulate_turn_totals_counts_every_turn():
+    """Each turn lands in exactly one bucket: a bust or a total >= hold_at."""
+    counts = simulate_turn_totals(2000, 20, rng=random.Random(7))
+
+    assert len(counts) == 26
+    assert sum(counts) == 2000
+    assert counts[0] > 0
+    assert not any(counts[1:20])
+
+
+def test_simulate_turn_totals_rejects_bad_threshold():
+    with pytest.raises(ValueError):
+        simulate_turn_totals(10, 0)
@@ -0,0 +1,146 @@
+"""
+Unit tests for the StateManager class, focusing on turn order handling.
+"""
+
+import pytest
+from src.core.player import Player
+from src.managers.state_manager import StateManager
+
+
+@pytest.fixture
+def state():
+    """A StateManager with player 1 seated and on turn."""
+    state = StateManager()
+    state.player1 = Player("Alice")
+    state.current_player = state.player1
+    return state
+
+
+def test_switch_player_vs_computer_alternates(state):
+    """In computer mode the turn alternates between player 1 and the computer."""
+    assert state.switch_player() is state.computer_player
+    assert state.switch_player() is state.player1
+
+
+def test_switch_player_vs_player_alternates(state):
+    """In two-player mode the turn alternates between both humans."""
+    state.player2 = Player("Bob")
+    assert state.switch_player() is state.player2
+    assert state.current_player is state.player2
+    assert state.switch_player() is state.player1
+
+
+def test_current_player_rejects_unseated_player(state):
+    """Only seated players can be made the current player."""
+    with pytest.raises(ValueError):
+        state.current_player = Player("Stranger")
+
+
+def test_reset_for_new_game_gives_turn_to_player1(state):
+    """A new game always starts with player 1."""
+    state.switch_player()
+    state.reset_for_new_game()
+    assert state.current_player is state.player1
+
+
+def test_switch_player_without_player1_returns_none():
+    """Switching before any player is seated is a no-op."""
+    assert StateManager().switch_player() is None
+
+
+def test_get_game_state_reports_current_values(state):
+    """get_game_state() reflects scores, turn and the computer opponent."""
+    state.player1.set_score(40)
+    state.computer_score = 25
+    state.turn_score = 7
+
+    snapshot = state.get_game_state()
+    assert snapshot["player1_name"] == "Alice"
+    assert snapshot["player1_score"] == 40
+    assert snapshot["player2_name"] == "Computer"
+    assert snapshot["player2_score"] == 25
+    assert snapshot["current_player"] == "Alice"
+    assert snapshot["turn_score"] == 7
+    assert snapshot["score_to_win"] == state.winning_score
+    assert snapshot["winner"] is None
+
+
+def test_get_game_state_returns_independent_copies(state):
+    """Mutating a returned snapshot does not affect later snapshots."""
+    first = state.get_game_state()
+    first["turn_score"] = 99
+    state.switch_player()
+
+    second = state.get_game_state()
+    assert second["turn_score"] == 0
+    assert second["current_player"] == "Computer"
+
+
+def test_game_hash_is_stable_for_identical_positions(state):
+    """The same position hashes identically across StateManager instances."""
+    other = StateManager()
+    other.player1 = Player("Someone Else")
+    other.current_player = other.player1
+
+    state.player1.set_score(30)
+    other.player1.set_score(30)
+    state.turn_score = other.turn_score = 9
+    assert state.game_hash() == other.game_hash()
+
+
+def test_game_hash_changes_with_position(state):
+    """Changing scores, turn score or seat changes the hash."""
+    seen = {state.game_hash()}
+    state.turn_score = 4
+    seen.add(state.game_hash())
+    state.player1.set_score(10)
+    seen.add(state.game_hash())
+    state.switch_player()
+    seen.add(state.game_hash())
+    assert len(seen) == 4
+
+
+def test_current_difficulty_defaults_and_caches_title():
+    """Difficulty has a default and its display title follows every change."""
+    from src.constants import DEFAULT_DIFFICULTY
+
+    state = StateManager()
+    assert state.current_difficulty == DEFAULT_DIFFICULTY
+    assert state.current_difficulty_title == DEFAULT_DIFFICULTY.title()
+
+    state.current_difficulty = "LEGENDARY"
+    assert state.current_difficulty == "legendary"
+    assert state.current_difficulty_title == "Legendary"
+
+
+def test_state_manager_uses_slots(state):
+    """StateManager instances have no per-instance __dict__."""
+    assert not hasattr(state, "__dict__")
+
+
+def test_reset_for_new_game_clears_round_state(state):
+    """Resetting clears scores, turn score and the finished-game flags."""
+    state.player1.set_score(80)
+    state.computer_score = 100
+    state.turn_score = 6
+    state.game_over = True
+    state.computer_won = True
+
+    state.reset_for_new_game()
+    assert state.player1.current_score == 0
+    assert state.computer_score == 0
+    assert state.turn_score == 0
+    assert state.game_over is False
+    assert state.winner is None
+    assert state.computer_won is False
+
+
+def test_has_active_session_spans_start_to_game_over(state):
+    """A session is active from a new game until the game is over."""
+    assert not state.has_active_session
+
+    state.reset_for_new_game()
+    assert state.has_active_session
+
+    state.game_over = True
+    assert not state.has_active_session
@@ -329,3 +329,97 @@ def test_get_game_history_summary_multiple_games(StatsManager, mock_deps, player
     assert " 2. Vs Computer: Winner: AI_Bot (100-70)" in summary
     assert "\n" == summary[-1]  # Check for the trailing newline
 
+
+
+# ----------------------------------------------------------------------
+# Test: Turn History (real StatsManager)
+# ----------------------------------------------------------------------
+
+def test_real_record_turn_builds_columnar_history(mock_deps):
+    """Recorded turns are stored column-wise and rebuilt as TurnRecords on demand."""
+    from src.managers.stats_manager import StatsManager as RealStatsManager
+
+    stats = RealStatsManager(*mock_deps)
+    stats.record_turn("p1", 12, 12)
+    stats.record_turn("p2", 8, 8)
+    stats.record_turn("p1", 20, 32)
+
+    assert list(stats._turn_player) == [0, 1, 0]
+    assert stats.turn_history == [("p1", 12, 12), ("p2", 8, 8), ("p1", 20, 32)]
+
+    last = stats.turn_history[-1]
+    assert (last.player, last.turn_score, last.total_score) == ("p1", 20, 32)
+
+
+def test_real_get_dice_history_returns_copy(mock_deps):
+    """get_dice_history() returns a list copy the caller may modify."""
+    from src.managers.stats_manager import StatsManager as RealStatsManager
+
+    stats = RealStatsManager(*mock_deps)
+    for roll in (3, 6, 1):
+        stats.record_roll(roll)
+
+    history = stats.get_dice_history()
+    assert history == [3, 6, 1]
+    history.append(4)
+    assert stats.get_dice_history() == [3, 6, 1]
+
+
+def test_real_dice_history_view_is_read_only(mock_deps):
+    """dice_history_view() exposes the rolls without a copy and refuses writes."""
+    from src.managers.stats_manager import StatsManager as RealStatsManager
+
+    stats = RealStatsManager(*mock_deps)
+    stats.record_rolls([2, 4])
+
+    with stats.dice_history_view() as view:
+        assert view.readonly and view.tolist() == [2, 4]
+        with pytest.raises(TypeError):
+            view[0] = 6
+    stats.record_roll(5)
+    assert stats.get_dice_history() == [2, 4, 5]
+
+
+def test_real_record_rolls_batches_histogram_and_history():
+    """record_rolls() feeds a whole batch to the histogram and the roll history."""
+    from src.core.histogram import Histogram
+    from src.managers.stats_manager import StatsManager as RealStatsManager
+
+    histogram = Histogram()
+    stats = RealStatsManager(MockHighScore(), histogram)
+    stats.record_roll(2)
+    stats.record_rolls([5, 5, 1])
+
+    assert stats.get_dice_history() == [2, 5, 5, 1]
+    assert stats.histogram.get_data() == {1: 1, 2: 1, 5: 2}
+
+
+def test_real_histogram_is_filled_lazily():
+    """Rolls reach the Histogram only when it is read, and only once each."""
+    from src.core.histogram import Histogram
+    from src.managers.stats_manager import StatsManager as RealStatsManager
+
+    histogram = Histogram()
+    stats = RealStatsManager(MockHighScore(), histogram)
+    for roll in (3, 3, 6):
+        stats.record_roll(roll)
+
+    assert histogram.get_data() == {}
+    assert stats.histogram is histogram
+    assert histogram.get_data() == {3: 2, 6: 1}
+
+    stats.record_roll(6)
+    assert "Dice Roll Frequencies" in stats.get_dice_history_summary()
+    assert histogram.get_data() == {3: 2, 6: 2}
+
+
+def test_real_turn_history_beyond_256_players(mock_deps):
+    """The player-index column holds more distinct players than fit in a byte."""
+    from src.managers.stats_manager import StatsManager as RealStatsManager
+
+    stats = RealStatsManager(*mock_deps)
+    for i in range(300):
+        stats.record_turn(f"p{i}", 5, 5)
+
+    assert len(stats.turn_history) == 300
+    assert stats.turn_history[-1] == ("p299", 5, 5)